@@ -4,6 +4,7 @@
 import sys
 import os
 import argparse
+import logging
 from pathlib import Path
 from typing import List
 from rag_ingestion import (
@@ -19,6 +20,7 @@ DEFAULT_PDF_LOCATION = Path(os.environ.get("PDF_PATH", "/app/data"))
 MARKDOWN_OUTPUT_DIR = Path(os.environ.get("MARKDOWN_DIR", "/app/data/markdown"))
 QDRANT_URL = os.environ.get("QDRANT_URL", "http://qdrant:6333")
 COLLECTION_NAME = os.environ.get("COLLECTION_NAME", "rag_collection")
+LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO")
 
 # Chunking configuration
 CHUNK_SIZE = 1000
@@ -28,6 +30,8 @@ CHUNKING_METHOD = "recursive"  # "recursive", "character", or "token"
 # Embedding configuration
 EMBEDDING_MODEL = "huggingface"  # "huggingface" (free)
 
+logger = logging.getLogger(__name__)
+
 def _resolve_pdf_inputs(input_path: Path) -> List[Path]:
     """Resolve input path to a list of PDF files."""
     if not input_path.exists():
@@ -36,81 +40,97 @@ def _resolve_pdf_inputs(input_path: Path) -> List[Path]:
         if input_path.suffix.lower() != ".pdf":
             raise ValueError(f"Not a PDF file: {input_path}")
         return [input_path]
-    # Directory: collect all PDFs (non-recursive)
-    pdf_files = sorted(input_path.glob("*.pdf"))
+    # Directory: collect all PDFs (non-recursive); a suffix compare per entry
+    # is cheaper than glob's pattern matching
+    pdf_files = sorted(
+        p for p in input_path.iterdir() if p.suffix.lower() == ".pdf" and p.is_file()
+    )
     if not pdf_files:
         raise FileNotFoundError(f"No PDF files found in directory: {input_path}")
     return pdf_files
 
 
+def _log_usage(error: Exception) -> None:
+    """Log an input resolution error followed by the command usage."""
+    logger.error("✗ %s", error)
+    logger.error("\nUsage:")
+    logger.error("  python ingest.py /app/data/file.pdf")
+    logger.error("  python ingest.py /app/data/file.pdf --tags 'Finance,Public'")
+    logger.error("  python ingest.py /app/data/file.pdf --required-role 'Admin'")
+    logger.error("  python ingest.py /app/data  # Ingest all PDFs in directory")
+    logger.error("\nConfigure defaults with env vars: PDF_PATH, MARKDOWN_DIR, QDRANT_URL, COLLECTION_NAME")
+
+
 def _prepare_output_dir(output_dir: Path) -> Path:
     output_dir.mkdir(parents=True, exist_ok=True)
     return output_dir
 
 
 def ingest_pdf(pdf_path: Path, vector_store: VectorStoreIngester, embedder: ChunkEmbedder, access_metadata: dict = None) -> None:
-    print("=" * 60)
-    print(f"Ingesting: {pdf_path}")
-    print("=" * 60)
+    logger.info("=" * 60)
+    logger.info("Ingesting: %s", pdf_path)
+    logger.info("=" * 60)
 
     # Step 1: PDF → Markdown
-    print("Step 1: Converting PDF to Markdown...")
+    logger.info("Step 1: Converting PDF to Markdown...")
     loader = PDFMarkdownLoader(
         pdf_path,
         output_dir=_prepare_output_dir(MARKDOWN_OUTPUT_DIR),
     )
     markdown_path = loader.to_markdown_file()
-    print(f"✓ Markdown saved to: {markdown_path}")
+    logger.info("✓ Markdown saved to: %s", markdown_path)
 
     # Step 2: Markdown → Chunks
-    print(f"\nStep 2: Chunking markdown (size={CHUNK_SIZE}, overlap={CHUNK_OVERLAP})...")
+    logger.info("\nStep 2: Chunking markdown (size=%d, overlap=%d)...", CHUNK_SIZE, CHUNK_OVERLAP)
     chunker = MarkdownChunker(
         chunk_size=CHUNK_SIZE,
         chunk_overlap=CHUNK_OVERLAP,
         method=CHUNKING_METHOD,
     )
     chunks = chunker.chunk_markdown_file(str(markdown_path))
-    print(f"✓ Created {len(chunks)} chunks")
+    logger.info("✓ Created %d chunks", len(chunks))
 
     # Step 2.5: Add access control metadata to chunks
     if access_metadata:
-        print(f"\nStep 2.5: Adding access control metadata...")
-        print(f"  Access Tags: {access_metadata.get('access_tags', [])}")
-        print(f"  Required Role: {access_metadata.get('required_role_strict', 'None')}")
+        logger.info("\nStep 2.5: Adding access control metadata...")
+        logger.info("  Access Tags: %s", access_metadata.get("access_tags", []))
+        logger.info("  Required Role: %s", access_metadata.get("required_role_strict", "None"))
         for chunk in chunks:
             chunk.metadata.update(access_metadata)
-            print("chunk meta: ", chunk.metadata)
-        print(f"✓ Access metadata added to {len(chunks)} chunks")
+            logger.debug("chunk meta: %s", chunk.metadata)
+        logger.info("✓ Access metadata added to %d chunks", len(chunks))
 
     # Step 3: Chunks → Embeddings
-    print(f"\nStep 3: Embedding chunks (model={EMBEDDING_MODEL})...")
+    logger.info("\nStep 3: Embedding chunks (model=%s)...", EMBEDDING_MODEL)
     embedded_chunks = embedder.embed_chunks(chunks)
-    print(f"✓ Embedded {len(embedded_chunks)} chunks")
-    print(f"  Embedding dimension: {embedder.get_embedding_dimension()}")
+    logger.info("✓ Embedded %d chunks", len(embedded_chunks))
+    logger.info("  Embedding dimension: %d", embedder.get_embedding_dimension())
 
     # Step 4: Embeddings → Vector Database
-    print(f"\nStep 4: Storing in vector database...")
-    print(f"  Database URL: {QDRANT_URL}")
-    print(f"  Collection: {COLLECTION_NAME}")
+    logger.info("\nStep 4: Storing in vector database...")
+    logger.info("  Database URL: %s", QDRANT_URL)
+    logger.info("  Collection: %s", COLLECTION_NAME)
 
     vector_store.ingest_chunks(embedded_chunks)
     vector_store.persist()
-    print(f"✓ Ingested {len(embedded_chunks)} chunks")
+    logger.info("✓ Ingested %d chunks", len(embedded_chunks))
 
     # Summary
-    print("\n" + "=" * 60)
-    print("Ingestion Complete!")
-    print("=" * 60)
-    print(f"✓ PDF processed: {pdf_path.name}")
-    print(f"✓ Markdown file: {markdown_path}")
-    print(f"✓ Chunks created: {len(chunks)}")
-    print(f"✓ Database URL: {QDRANT_URL}")
-    print(f"✓ Collection: {COLLECTION_NAME}")
-    print("=" * 60 + "\n")
+    logger.info("\n" + "=" * 60)
+    logger.info("Ingestion Complete!")
+    logger.info("=" * 60)
+    logger.info("✓ PDF processed: %s", pdf_path.name)
+    logger.info("✓ Markdown file: %s", markdown_path)
+    logger.info("✓ Chunks created: %d", len(chunks))
+    logger.info("✓ Database URL: %s", QDRANT_URL)
+    logger.info("✓ Collection: %s", COLLECTION_NAME)
+    logger.info("=" * 60 + "\n")
 
 
 def main():
     """Run the ingestion pipeline for one or more PDFs."""
+    logging.basicConfig(level=LOG_LEVEL, format="%(message)s", stream=sys.stdout)
+
     # Parse command line arguments
     parser = argparse.ArgumentParser(
         description="Ingest PDF documents with optional role-aware access control"
@@ -157,24 +177,18 @@ def main():
     try:
         pdf_files = _resolve_pdf_inputs(input_path)
     except Exception as exc:
-        print(f"✗ {exc}")
-        print("\nUsage:")
-        print("  python ingest.py /app/data/file.pdf")
-        print("  python ingest.py /app/data/file.pdf --tags 'Finance,Public'")
-        print("  python ingest.py /app/data/file.pdf --required-role 'Admin'")
-        print("  python ingest.py /app/data  # Ingest all PDFs in directory")
-        print("\nConfigure defaults with env vars: PDF_PATH, MARKDOWN_DIR, QDRANT_URL, COLLECTION_NAME")
+        _log_usage(exc)
         sys.exit(1)
 
-    print("=" * 60)
-    print("RAG Document Ingestion Pipeline")
-    print("=" * 60)
-    print(f"Inputs: {len(pdf_files)} PDF(s)")
-    print(f"Database URL: {QDRANT_URL}")
-    print(f"Collection: {COLLECTION_NAME}")
+    logger.info("=" * 60)
+    logger.info("RAG Document Ingestion Pipeline")
+    logger.info("=" * 60)
+    logger.info("Inputs: %d PDF(s)", len(pdf_files))
+    logger.info("Database URL: %s", QDRANT_URL)
+    logger.info("Collection: %s", COLLECTION_NAME)
     if access_metadata:
-        print(f"Access Control: {access_metadata}")
-    print()
+        logger.info("Access Control: %s", access_metadata)
+    logger.info("")
 
     try:
         embedder = ChunkEmbedder(model_name=EMBEDDING_MODEL)
@@ -190,13 +204,10 @@ def main():
         for pdf_file in pdf_files:
             ingest_pdf(pdf_file, vector_store, embedder, access_metadata)
 
-        print("✓ All PDFs processed successfully.")
-
-    except Exception as exc:
-        print(f"\n✗ Error during ingestion: {exc}")
-        import traceback
+        logger.info("✓ All PDFs processed successfully.")
 
-        traceback.print_exc()
+    except Exception:
+        logger.exception("\n✗ Error during ingestion")
         sys.exit(1)
 
 
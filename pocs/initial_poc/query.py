@@ -101,6 +101,26 @@ def build_access_filter(user_role: str = None, user_tags: list = None,
     # Return Qdrant Filter with should (OR) logic
     return Filter(should=should_conditions)
 
+def _format_result(index: int, doc, score: float) -> str:
+    """Format one retrieved document (score, content and metadata) for display."""
+    metadata = doc.metadata
+    lines = [
+        f"\n[{index}] Similarity Score: {score:.4f}",
+        f"    Content: {doc.page_content}",
+    ]
+    if metadata:
+        lines.append(f"    Metadata: {metadata}")
+        # Display access control metadata if present
+        access_info = {
+            key: metadata[key]
+            for key in ("access_tags", "required_role_strict")
+            if key in metadata
+        }
+        if access_info:
+            lines.append(f"    Access Control: {access_info}")
+    return "\n".join(lines)
+
+
 def main():
     # Parse command line arguments
     parser = argparse.ArgumentParser(
@@ -184,40 +204,36 @@ def main():
         print("Searching...")
         results_with_scores = pipeline.retrieve_with_scores(query, metadata_filter=metadata_filter)
         
-        # Step 5: Display results with similarity scores
+        # Step 5: Display results with similarity scores, built as one string
+        # and printed once instead of one print call per line
         if len(results_with_scores) == 0:
-            print("\n⚠️  No documents found matching your query and access permissions.")
-            print("    This could mean:")
-            print("    - No documents match the search query")
-            print("    - You don't have access to documents containing relevant information")
-            print("    - No documents have been ingested yet")
+            lines = [
+                "\n⚠️  No documents found matching your query and access permissions.",
+                "    This could mean:",
+                "    - No documents match the search query",
+                "    - You don't have access to documents containing relevant information",
+                "    - No documents have been ingested yet",
+            ]
         else:
-            print(f"\nFound {len(results_with_scores)} relevant documents:\n")
-            print("-" * 60)
-            print("Similarity Score Guide:")
-            print("  - Higher score = More similar to query")
-            print("  - Score range depends on distance metric (usually 0-1 or 0-2)")
-            print("  - For cosine similarity: closer to 1 = more similar")
-            print("-" * 60)
-            
+            lines = [
+                f"\nFound {len(results_with_scores)} relevant documents:\n",
+                "-" * 60,
+                "Similarity Score Guide:",
+                "  - Higher score = More similar to query",
+                "  - Score range depends on distance metric (usually 0-1 or 0-2)",
+                "  - For cosine similarity: closer to 1 = more similar",
+                "-" * 60,
+            ]
             for i, (doc, score) in enumerate(results_with_scores, 1):
-                print(f"\n[{i}] Similarity Score: {score:.4f}")
-                print(f"    Content: {doc.page_content}")
-                if doc.metadata:
-                    # Display access control metadata if present
-                    access_info = {}
-                    if "access_tags" in doc.metadata:
-                        access_info["access_tags"] = doc.metadata["access_tags"]
-                    if "required_role_strict" in doc.metadata:
-                        access_info["required_role_strict"] = doc.metadata["required_role_strict"]
-                    print(f"    Metadata: {doc.metadata}")
-                    if access_info:
-                        print(f"    Access Control: {access_info}")
-        
-        print("\n" + "=" * 60)
-        print("Note: Higher similarity scores indicate better matches to your query.")
-        print("=" * 60)
-        
+                lines.append(_format_result(i, doc, score))
+
+        lines += [
+            "\n" + "=" * 60,
+            "Note: Higher similarity scores indicate better matches to your query.",
+            "=" * 60,
+        ]
+        print("\n".join(lines))
+
     except Exception as e:
         print(f"✗ Error: {e}")
         import traceback
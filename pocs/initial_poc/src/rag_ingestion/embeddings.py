@@ -172,18 +172,26 @@ class ChunkEmbedder:
             config = model_config or {}
             self.embedding_model = EmbeddingModelFactory.create(model_name, **config)
             self.model_name = model_name
+        self._dimension: Optional[int] = None
 
-    def embed_chunks(self, chunks: List[Document]) -> List[Document]:
+    def embed_chunks(
+        self,
+        chunks: List[Document],
+        batch_size: Optional[int] = None,
+    ) -> List[Document]:
         """Embed a list of document chunks.
 
         Parameters
         ----------
         chunks
             List of LangChain Document objects to embed.
+        batch_size
+            Maximum number of chunks per embed_documents call.
+            If None, all chunks are embedded in a single call.
 
         Returns
         -------
-        List of Document objects with embeddings stored in metadata.
+        The same Document objects, with embeddings stored in their metadata.
         The interface is consistent regardless of the underlying model.
         """
         if not chunks:
@@ -193,24 +201,27 @@ class ChunkEmbedder:
         texts = [chunk.page_content for chunk in chunks]
 
         # Generate embeddings - model-agnostic interface
-        embeddings = self.embedding_model.embed_documents(texts)
+        # Texts are embedded shortest first so each batch holds texts of
+        # similar length (transformer models pad a batch to its longest
+        # text), then the vectors are put back in chunk order
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        batch_size = batch_size or len(texts)
+        embeddings: List[List[float]] = [[] for _ in texts]
+        for start in range(0, len(order), batch_size):
+            batch = order[start:start + batch_size]
+            vectors = self.embedding_model.embed_documents([texts[i] for i in batch])
+            for i, vector in zip(batch, vectors):
+                embeddings[i] = vector
 
         # Add embeddings to document metadata
-        # This format is consistent regardless of model
-        embedded_chunks = []
+        # This format is consistent regardless of model. The chunks are
+        # updated in place rather than copied, so only one Document per
+        # chunk is kept in memory.
         for chunk, embedding in zip(chunks, embeddings):
-            # Create a copy to avoid modifying original
-            embedded_chunk = Document(
-                page_content=chunk.page_content,
-                metadata={
-                    **chunk.metadata,
-                    "embedding": embedding,
-                    "embedding_model": self.model_name,  # Track which model was used
-                }
-            )
-            embedded_chunks.append(embedded_chunk)
+            chunk.metadata["embedding"] = embedding
+            chunk.metadata["embedding_model"] = self.model_name  # Track which model was used
 
-        return embedded_chunks
+        return chunks
 
     def embed_query(self, query: str) -> List[float]:
         """Embed a search query.
@@ -233,7 +244,25 @@ class ChunkEmbedder:
         Returns
         -------
         Dimension of the embedding vectors.
+        The value is computed once per model.
         """
+        if self._dimension is None:
+            self._dimension = self._model_dimension()
+        return self._dimension
+
+    def _model_dimension(self) -> int:
+        """Read the dimension from the model, embedding a test text only if needed."""
+        # sentence-transformers models report it without running the model
+        # (langchain_huggingface stores the model as _client, langchain_community as client)
+        client = getattr(self.embedding_model, "_client", None) or getattr(
+            self.embedding_model, "client", None
+        )
+        get_dimension = getattr(client, "get_sentence_embedding_dimension", None)
+        if callable(get_dimension):
+            dimension = get_dimension()
+            if dimension:
+                return dimension
+
         # Test with a small text to get dimension
         test_embedding = self.embedding_model.embed_query("test")
         return len(test_embedding)
@@ -255,6 +284,7 @@ class ChunkEmbedder:
         config = model_config or {}
         self.embedding_model = EmbeddingModelFactory.create(model_name, **config)
         self.model_name = model_name
+        self._dimension = None
 
 
 __all__ = ["ChunkEmbedder", "EmbeddingModelFactory"]
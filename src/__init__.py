@@ -5,14 +5,31 @@ Utilities for converting PDF documents into Markdown, chunking, embedding,
 vector storage, and retrieval.
 """
 
-from .chunkers import Chunker, ChunkerFactory, LangChainChunker
 from .config import Config
-from .embeddings import EmbeddingModelFactory, Embeddings
-from .llms import LLMFactory
-from .loaders import DocumentLoader, LoaderFactory, LoaderHelper, PyMuPDFLoader
+from .lazy_imports import lazy_getattr
 from .logger import Logger
-from .retrievers import DocumentRetriever, Retriever, RetrieverFactory
-from .vector_stores import VectorStore, VectorStoreFactory
+
+# Factories and implementations are imported on first access, so importing
+# Config or Logger does not load LangChain or the model libraries.
+__getattr__ = lazy_getattr(__name__, {
+    "Chunker": ".chunkers",
+    "ChunkerFactory": ".chunkers",
+    "LangChainChunker": ".chunkers",
+    "EmbeddingModelFactory": ".embeddings",
+    "Embeddings": ".embeddings",
+    "LLMFactory": ".llms",
+    "DocumentLoader": ".loaders",
+    "LoaderFactory": ".loaders",
+    "LoaderHelper": ".loaders",
+    "PyMuPDFLoader": ".loaders",
+    "DocumentRetriever": ".retrievers",
+    "Retriever": ".retrievers",
+    "RetrieverFactory": ".retrievers",
+    "VectorStore": ".vector_stores",
+    "VectorStoreFactory": ".vector_stores",
+    "RAGComponents": ".components",
+    "initialize_rag_components": ".components",
+})
 
 __all__ = [
     # Protocols
@@ -34,6 +51,8 @@ __all__ = [
     "LLMFactory",
     # Helpers
     "LoaderHelper",
+    "RAGComponents",
+    "initialize_rag_components",
     # Config
     "Config",
     # Logger
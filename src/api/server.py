@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
 """FastAPI server exposing OpenAI-compatible chat completions endpoint"""
 
+import asyncio
 import logging
+import threading
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException
@@ -10,7 +12,13 @@ from fastapi.middleware.cors import CORSMiddleware
 from src import Config
 from src.api.helpers import build_chat_response, estimate_token_usage
 from src.api.models import ChatCompletionRequest, ChatCompletionResponse
-from src.components import RAGComponents, execute_query, initialize_rag_components
+from src.components import (
+    RAGComponents,
+    close_components,
+    execute_query,
+    initialize_rag_components,
+    warm_up_components,
+)
 from src.logger import Logger
 from src.pipeline import PipelineStatus
 
@@ -30,6 +38,9 @@ async def lifespan(app: FastAPI):
         
         app.state.components = initialize_rag_components(config)
         app.state.initialized = True
+        threading.Thread(
+            target=warm_up_components, args=(app.state.components,), daemon=True
+        ).start()
         
         app.state.logger.info("Server startup complete")
     except Exception as e:
@@ -39,6 +50,8 @@ async def lifespan(app: FastAPI):
     yield
     
     app.state.logger.info("Server shutting down")
+    if app.state.initialized:
+        close_components(app.state.components)
 
 
 app = FastAPI(
@@ -95,7 +108,9 @@ async def chat_completions(request: ChatCompletionRequest) -> ChatCompletionResp
     logger.info(f"Processing query: {query}")
 
     try:
-        context = execute_query(components, query)
+        # Run in a worker thread so concurrent requests overlap (and their
+        # query embeddings can be batched together)
+        context = await asyncio.to_thread(execute_query, components, query)
 
         if context.status == PipelineStatus.FAILED:
             logger.error(f"Pipeline failed: {context.error}")
@@ -1,9 +1,13 @@
 """Chunker implementations."""
 
-from .factory import ChunkerFactory
-from .langchain_chunker import LangChainChunker
-from .protocol import Chunker
+from ..lazy_imports import lazy_getattr
 from .types import ChunkerType
 
-__all__ = ["Chunker", "ChunkerFactory", "ChunkerType", "LangChainChunker"]
+# Imported on first access; they pull in LangChain and model libraries.
+__getattr__ = lazy_getattr(__name__, {
+    "Chunker": ".protocol",
+    "ChunkerFactory": ".factory",
+    "LangChainChunker": ".langchain_chunker",
+})
 
+__all__ = ["Chunker", "ChunkerFactory", "ChunkerType", "LangChainChunker"]
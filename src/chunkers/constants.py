@@ -4,11 +4,17 @@ CHUNKING_METHOD_RECURSIVE = "recursive"
 CHUNKING_METHOD_CHARACTER = "character"
 CHUNKING_METHOD_TOKEN = "token"
 
-RECURSIVE_SEPARATORS = ["\n\n", "\n", ". ", " ", ""]
+RECURSIVE_SEPARATORS = ("\n\n", "\n", ". ", " ", "")
+TOKEN_ENCODING_NAME = "gpt2"
 
 DEFAULT_CHUNK_SIZE = 1000
 DEFAULT_CHUNK_OVERLAP = 200
 
+CHUNKER_CACHE_SIZE = 16
+SPLITTER_CACHE_SIZE = 32
+
 CHUNK_INDEX_METADATA_KEY = "chunk_index"
 TOTAL_CHUNKS_METADATA_KEY = "total_chunks"
+SOURCE_METADATA_KEY = "source"
+FILE_NAME_METADATA_KEY = "file_name"
 
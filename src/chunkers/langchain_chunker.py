@@ -1,8 +1,11 @@
 """LangChain-based chunker implementation."""
 from __future__ import annotations
 
+import functools
+import os
+from collections import Counter, defaultdict
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
 from langchain.schema import Document
 from langchain.text_splitter import (
@@ -11,19 +14,39 @@ from langchain.text_splitter import (
     TokenTextSplitter,
 )
 
+try:
+    import tiktoken
+except ImportError:  # optional: only needed for the token method
+    tiktoken = None
+
 from ..constants import DEFAULT_ENCODING
 from .constants import (
     CHUNK_INDEX_METADATA_KEY,
+    CHUNKER_CACHE_SIZE,
     CHUNKING_METHOD_CHARACTER,
     CHUNKING_METHOD_RECURSIVE,
     CHUNKING_METHOD_TOKEN,
     DEFAULT_CHUNK_OVERLAP,
     DEFAULT_CHUNK_SIZE,
+    FILE_NAME_METADATA_KEY,
     RECURSIVE_SEPARATORS,
+    SOURCE_METADATA_KEY,
+    SPLITTER_CACHE_SIZE,
+    TOKEN_ENCODING_NAME,
     TOTAL_CHUNKS_METADATA_KEY,
 )
 from .protocol import Chunker
 
+# Splitter class and extra keyword arguments for each chunking method.
+_SPLITTERS: dict[str, tuple[type, dict[str, Any]]] = {
+    CHUNKING_METHOD_RECURSIVE: (
+        RecursiveCharacterTextSplitter,
+        {"separators": list(RECURSIVE_SEPARATORS)},
+    ),
+    CHUNKING_METHOD_CHARACTER: (CharacterTextSplitter, {"separator": "\n\n"}),
+    CHUNKING_METHOD_TOKEN: (TokenTextSplitter, {"encoding_name": TOKEN_ENCODING_NAME}),
+}
+
 
 class LangChainChunker:
     """Chunk markdown text or LangChain documents using LangChain splitters.
@@ -55,53 +78,34 @@ class LangChainChunker:
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
         self.method = method
-        self._splitter = self._create_splitter()
-
-    def _create_splitter(self):
-        """Create the appropriate text splitter based on the chunking method.
+        self._splitter = _get_splitter(method, chunk_size, chunk_overlap)
 
-        Returns
-        -------
-        Text splitter instance (RecursiveCharacterTextSplitter, CharacterTextSplitter,
-        or TokenTextSplitter) configured with chunk_size and chunk_overlap.
-
-        Raises
-        ------
-        ValueError
-            If the method is not one of the supported methods.
-        """
-        splitters = {
-            CHUNKING_METHOD_RECURSIVE: (
-                RecursiveCharacterTextSplitter,
-                {"separators": RECURSIVE_SEPARATORS},
-            ),
-            CHUNKING_METHOD_CHARACTER: (CharacterTextSplitter, {"separator": "\n\n"}),
-            CHUNKING_METHOD_TOKEN: (TokenTextSplitter, {}),
-        }
-        if self.method not in splitters:
-            raise ValueError(
-                f"Unknown method: {self.method}. Choose from: {', '.join(splitters.keys())}"
-            )
-        splitter_class, extra_kwargs = splitters[self.method]
-        return splitter_class(
-            chunk_size=self.chunk_size,
-            chunk_overlap=self.chunk_overlap,
-            **extra_kwargs
-        )
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all cached splitters and chunkers."""
+        _get_splitter.cache_clear()
+        _get_langchain_chunker.cache_clear()
 
     def chunk_text(self, text: str, metadata: Optional[dict] = None) -> list[Document]:
         """Chunk a markdown text string into LangChain Documents."""
         if not text or not text.strip():
             return []
 
-        temp_doc = Document(page_content=text, metadata=metadata or {})
-        chunks = self._splitter.split_documents([temp_doc])
+        base_metadata = metadata or {}
+        texts = self._splitter.split_text(text)
+        total_chunks = len(texts)
 
-        for i, chunk in enumerate(chunks):
-            chunk.metadata[CHUNK_INDEX_METADATA_KEY] = i
-            chunk.metadata[TOTAL_CHUNKS_METADATA_KEY] = len(chunks)
-
-        return chunks
+        return [
+            Document(
+                page_content=chunk_text,
+                metadata={
+                    **base_metadata,
+                    CHUNK_INDEX_METADATA_KEY: i,
+                    TOTAL_CHUNKS_METADATA_KEY: total_chunks,
+                },
+            )
+            for i, chunk_text in enumerate(texts)
+        ]
 
     def chunk_documents(self, documents: list[Document]) -> list[Document]:
         """Chunk a list of LangChain Documents into smaller chunks."""
@@ -110,14 +114,17 @@ class LangChainChunker:
 
         all_chunks = self._splitter.split_documents(documents)
 
+        total_chunks = len(all_chunks)
         for i, chunk in enumerate(all_chunks):
-            chunk.metadata[CHUNK_INDEX_METADATA_KEY] = i
-            chunk.metadata[TOTAL_CHUNKS_METADATA_KEY] = len(all_chunks)
+            chunk.metadata.update({
+                CHUNK_INDEX_METADATA_KEY: i,
+                TOTAL_CHUNKS_METADATA_KEY: total_chunks,
+            })
 
         return all_chunks
 
     def chunk_markdown_file(
-        self, file_path: str, encoding: str = DEFAULT_ENCODING
+        self, file_path: Union[str, Path], encoding: str = DEFAULT_ENCODING
     ) -> list[Document]:
         """Load a markdown file and chunk it.
 
@@ -132,22 +139,148 @@ class LangChainChunker:
         -------
         List of chunked LangChain Document objects.
         """
-        path = Path(file_path)
-        if not path.exists():
-            raise FileNotFoundError(f"Markdown file not found: {file_path}")
+        document = self._load_markdown_document(file_path, encoding)
+        return self.chunk_text(document.page_content, metadata=document.metadata)
 
-        text = path.read_text(encoding=encoding)
-        metadata = {
-            "source": str(path),
-            "file_name": path.name,
-        }
+    def chunk_markdown_files(
+        self, file_paths: list[Union[str, Path]], encoding: str = DEFAULT_ENCODING
+    ) -> list[Document]:
+        """Load several markdown files and chunk them in a single splitter pass.
 
-        return self.chunk_text(text, metadata=metadata)
+        Parameters
+        ----------
+        file_paths
+            Paths to the markdown files.
+        encoding
+            File encoding (default: utf-8).
+
+        Returns
+        -------
+        List of chunked LangChain Document objects for all files, in input order.
+        The chunk index and total chunk count are numbered per source file.
+        """
+        documents = [
+            self._load_markdown_document(file_path, encoding) for file_path in file_paths
+        ]
+        documents = [doc for doc in documents if doc.page_content.strip()]
+        if not documents:
+            return []
+
+        if self.method == CHUNKING_METHOD_TOKEN:
+            chunks = self._split_documents_on_tokens(documents)
+        else:
+            chunks = self._splitter.split_documents(documents)
+
+        totals = Counter(chunk.metadata[SOURCE_METADATA_KEY] for chunk in chunks)
+        next_index: dict[str, int] = defaultdict(int)
+        for chunk in chunks:
+            metadata = chunk.metadata
+            source = metadata[SOURCE_METADATA_KEY]
+            metadata.update({
+                CHUNK_INDEX_METADATA_KEY: next_index[source],
+                TOTAL_CHUNKS_METADATA_KEY: totals[source],
+            })
+            next_index[source] += 1
+
+        return chunks
+
+    def _split_documents_on_tokens(self, documents: list[Document]) -> list[Document]:
+        """Token-split documents with one batched tiktoken encode call.
+
+        Windows are sliced exactly like LangChain's TokenTextSplitter, but all
+        texts are tokenized together across tiktoken's worker threads.
+        """
+        if tiktoken is None:
+            return self._splitter.split_documents(documents)
+
+        encoding = tiktoken.get_encoding(TOKEN_ENCODING_NAME)
+        token_ids = encoding.encode_ordinary_batch(
+            [doc.page_content for doc in documents],
+            num_threads=os.cpu_count() or 1,
+        )
+        step = self.chunk_size - self.chunk_overlap
+
+        chunks = []
+        for doc, ids in zip(documents, token_ids):
+            for start in range(0, len(ids), step):
+                end = min(start + self.chunk_size, len(ids))
+                chunks.append(
+                    Document(
+                        page_content=encoding.decode(ids[start:end]),
+                        metadata=dict(doc.metadata),
+                    )
+                )
+                if end == len(ids):
+                    break
+        return chunks
+
+    @staticmethod
+    def _load_markdown_document(file_path: Union[str, Path], encoding: str) -> Document:
+        """Read a markdown file into a Document carrying its source metadata."""
+        path = file_path if isinstance(file_path, Path) else Path(file_path)
+        try:
+            text = path.read_text(encoding=encoding)
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"Markdown file not found: {file_path}") from e
+
+        return Document(
+            page_content=text,
+            metadata={
+                SOURCE_METADATA_KEY: str(path),
+                FILE_NAME_METADATA_KEY: path.name,
+            },
+        )
+
+
+@functools.lru_cache(maxsize=SPLITTER_CACHE_SIZE)
+def _get_splitter(method: str, chunk_size: int, chunk_overlap: int):
+    """Create (or reuse) the text splitter for a chunking method.
+
+    Splitters hold no per-text state, so a single instance can be shared by
+    every chunker configured with the same settings.
+
+    Returns
+    -------
+    Text splitter instance (RecursiveCharacterTextSplitter, CharacterTextSplitter,
+    or TokenTextSplitter) configured with chunk_size and chunk_overlap.
+
+    Raises
+    ------
+    ValueError
+        If the method is not one of the supported methods.
+    """
+    if method not in _SPLITTERS:
+        raise ValueError(
+            f"Unknown method: {method}. Choose from: {', '.join(_SPLITTERS.keys())}"
+        )
+    splitter_class, extra_kwargs = _SPLITTERS[method]
+    return splitter_class(
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+        **extra_kwargs
+    )
+
+
+@functools.lru_cache(maxsize=CHUNKER_CACHE_SIZE)
+def _get_langchain_chunker(chunk_size: int, chunk_overlap: int, method: str) -> LangChainChunker:
+    """Return a shared chunker for the given settings.
+
+    The chunker only holds its configuration and a stateless splitter, so
+    instances can be reused across files ingested with the same settings.
+    """
+    return LangChainChunker(
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+        method=method,
+    )
 
 
 def create_langchain_chunker(config: dict[str, Any]) -> Chunker:
     """Create a LangChain chunker from configuration.
 
+    Chunkers are cached per (chunk_size, chunk_overlap, method), so repeated
+    calls with the same configuration return the same instance.
+
     Parameters
     ----------
     config
@@ -176,8 +309,4 @@ def create_langchain_chunker(config: dict[str, Any]) -> Chunker:
             f"{CHUNKING_METHOD_TOKEN}, got: {method}"
         )
 
-    return LangChainChunker(
-        chunk_size=chunk_size,
-        chunk_overlap=chunk_overlap,
-        method=method,
-    )
+    return _get_langchain_chunker(chunk_size, chunk_overlap, method)
@@ -1,7 +1,8 @@
 """Protocol for chunker implementations."""
 from __future__ import annotations
 
-from typing import Optional, Protocol
+from pathlib import Path
+from typing import Optional, Protocol, Union
 
 from langchain.schema import Document
 
@@ -26,9 +27,17 @@ class Chunker(Protocol):
 
     def chunk_markdown_file(
         self,
-        file_path: str,
+        file_path: Union[str, Path],
         encoding: str = DEFAULT_ENCODING
     ) -> list[Document]:
         """Load a markdown file and chunk it."""
         ...
 
+    def chunk_markdown_files(
+        self,
+        file_paths: list[Union[str, Path]],
+        encoding: str = DEFAULT_ENCODING
+    ) -> list[Document]:
+        """Load several markdown files and chunk them together."""
+        ...
+
@@ -0,0 +1,10 @@
+"""Command-line entry points for ingestion and querying."""
+
+from ..lazy_imports import lazy_getattr
+
+# Imported on first access; the query server loads the RAG components.
+__getattr__ = lazy_getattr(__name__, {
+    "answer_query": ".query_server",
+})
+
+__all__ = ["answer_query"]
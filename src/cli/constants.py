@@ -7,12 +7,20 @@ ENUMERATE_START = 1
 SEPARATOR_LENGTH = 60
 SEPARATOR_CHAR = "="
 ALT_SEPARATOR_CHAR = "-"
+SEPARATOR_LINE = SEPARATOR_CHAR * SEPARATOR_LENGTH
+ALT_SEPARATOR_LINE = ALT_SEPARATOR_CHAR * SEPARATOR_LENGTH
 
 SCORE_DECIMAL_PLACES = 4
 MIN_SCORE = 0
 MAX_SCORE_COSINE = 1
 MAX_SCORE_DISTANCE = 2
 
+# Ingestion embeds and saves loaded files in groups of at least this many
+# embedding batches, while the remaining files are still being loaded
+EMBED_GROUP_BATCHES = 8
+
+QUERY_SOCKET_ENCODING = "utf-8"
+
 EXIT_CODE_SUCCESS = 0
 EXIT_CODE_ERROR = 1
 
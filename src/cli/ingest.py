@@ -1,11 +1,20 @@
 #!/usr/bin/env python3
 """Main script to ingest media files into the vector database."""
 
+import functools
+import json
 import logging
 import sys
+from collections import defaultdict
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Optional
+
+from langchain.schema import Document
 
 from src import (
+    Chunker,
     ChunkerFactory,
     Config,
     EmbeddingModelFactory,
@@ -14,47 +23,48 @@ from src import (
     VectorStore,
     VectorStoreFactory,
 )
+from src.chunkers.constants import SOURCE_METADATA_KEY
 from src.cli.constants import (
+    EMBED_GROUP_BATCHES,
     EXIT_CODE_ERROR,
-    SEPARATOR_CHAR,
-    SEPARATOR_LENGTH,
+    SEPARATOR_LINE,
 )
+from src.embeddings.autotune import find_optimal_embed_batch
+from src.embeddings.cache import EmbeddingCache
+from src.embeddings.constants import EMBEDDING_METADATA_KEY
 from src.loaders.constants import SUPPORTED_FILE_EXTENSIONS
 from src.loaders.helpers import LoaderHelper
 from src.loaders.types import LoaderType
 from src.logger import Logger
 from src.pipeline import IngestionContext, PipelineExecutor, PipelineStatus
 from src.pipeline.steps import (
-    ChunkStep,
     EmbeddingGenerationStep,
     LoadStep,
     SaveStep,
 )
+from src.vector_stores.constants import INGESTED_FILES_DB_NAME
+from src.vector_stores.ingested_files import IngestedFiles
 
 
-def ingest_file(
-    file_path: Path,
-    config: Config,
-    embedding_model: Embeddings,
-    vector_store: VectorStore,
-) -> None:
-    """Ingest a media file into the vector database using the pipeline pattern.
+def load_file(file_path: Path, config: Config) -> IngestionContext:
+    """Convert a media file to Markdown using the load step.
 
     Parameters
     ----------
     file_path
-        Path to the media file to ingest.
+        Path to the media file to load.
     config
         Configuration object.
-    embedding_model
-        Embedding model instance.
-    vector_store
-        Vector store instance.
+
+    Returns
+    -------
+    IngestionContext
+        Context with markdown_path and raw_text set.
     """
     logger = logging.getLogger()
-    logger.info(SEPARATOR_CHAR * SEPARATOR_LENGTH)
-    logger.info(f"Ingesting: {file_path}")
-    logger.info(SEPARATOR_CHAR * SEPARATOR_LENGTH)
+    logger.info(SEPARATOR_LINE)
+    logger.info("Loading: %s", file_path)
+    logger.info(SEPARATOR_LINE)
 
     loader_name_str, loader_config_from_mapping = (
         LoaderHelper.get_loader_config_for_file(file_path, config)
@@ -71,8 +81,7 @@ def ingest_file(
         ) from exc
 
     logger.info(
-        f"Converting {file_extension} file to Markdown "
-        f"(loader: {loader_name_str})..."
+        "Converting %s file to Markdown (loader: %s)...", file_extension, loader_name_str
     )
     loader_config = LoaderHelper.create_loader_config(
         file_path,
@@ -82,6 +91,306 @@ def ingest_file(
     )
     loader = LoaderFactory.create(loader_type, **loader_config)
 
+    context = IngestionContext(file_path=file_path)
+    executor = PipelineExecutor([LoadStep(loader)])
+    context = executor.execute(context)
+
+    if context.status == PipelineStatus.FAILED:
+        raise RuntimeError(f"Pipeline failed: {context.error}")
+
+    return context
+
+
+def chunk_files(contexts: list[IngestionContext], chunker: Chunker) -> None:
+    """Chunk the Markdown of a group of loaded files in a single chunker call.
+
+    Chunks are grouped back onto the context of the file they came from.
+
+    Parameters
+    ----------
+    contexts
+        Ingestion contexts with markdown_path set.
+    chunker
+        Chunker instance created by ChunkerFactory.
+    """
+    logger = logging.getLogger()
+    logger.info("Chunking %d markdown file(s)...", len(contexts))
+
+    chunks = chunker.chunk_markdown_files(
+        [context.markdown_path for context in contexts]
+    )
+    _assign_chunks_by_source(contexts, chunks)
+
+    logger.info("Created %d chunks", len(chunks))
+
+
+def open_embedding_cache(config: Config) -> Optional[EmbeddingCache]:
+    """Open the embedding cache configured in embedding.cache_path, if any."""
+    if not config.embedding.cache_path:
+        return None
+    return EmbeddingCache(
+        config.embedding.cache_path,
+        provider=config.embedding.embed_name.value,
+        model=config.embedding.get_model_id(),
+        fuzzy=config.embedding.cache_fuzzy,
+    )
+
+
+def embed_files(
+    contexts: list[IngestionContext],
+    config: Config,
+    embedding_model: Embeddings,
+    batch_size: int,
+    cache: Optional[EmbeddingCache] = None,
+) -> None:
+    """Embed the chunks of several loaded files together, in fixed-size batches.
+
+    Batches span file boundaries, so every embedding call except the last one
+    is full regardless of how many chunks each file produced.
+
+    Parameters
+    ----------
+    contexts
+        Ingestion contexts with chunks set.
+    config
+        Configuration object.
+    embedding_model
+        Embedding model instance.
+    batch_size
+        Number of chunks per embedding call.
+    cache
+        Optional embedding cache; cached chunks are not re-embedded.
+    """
+    logger = logging.getLogger()
+    logger.info(
+        "Embedding chunks (model=%s, batch size=%d)...",
+        config.embedding.embed_name,
+        batch_size,
+    )
+
+    combined = IngestionContext(
+        file_path=config.paths.input_path,
+        chunks=[chunk for context in contexts for chunk in context.chunks],
+    )
+    executor = PipelineExecutor([
+        EmbeddingGenerationStep(
+            embedding_model,
+            config.embedding.embed_name,
+            batch_size=batch_size,
+            cache=cache,
+            max_concurrency=config.embedding.get_max_concurrent_requests(),
+        ),
+    ])
+    combined = executor.execute(combined)
+
+    if combined.status == PipelineStatus.FAILED:
+        raise RuntimeError(f"Pipeline failed: {combined.error}")
+
+    _assign_chunks_by_source(contexts, combined.chunks)
+    for context in contexts:
+        context.vectors = [
+            chunk.metadata[EMBEDDING_METADATA_KEY] for chunk in context.chunks
+        ]
+
+
+def _assign_chunks_by_source(
+    contexts: list[IngestionContext], chunks: list[Document]
+) -> None:
+    """Group chunks back onto the context of the markdown file they came from."""
+    chunks_by_source: dict[str, list[Document]] = defaultdict(list)
+    for chunk in chunks:
+        chunks_by_source[chunk.metadata[SOURCE_METADATA_KEY]].append(chunk)
+
+    for context in contexts:
+        context.chunks = chunks_by_source.get(str(context.markdown_path), [])
+
+
+def embed_and_save_files(
+    contexts: list[IngestionContext],
+    config: Config,
+    embedding_model: Embeddings,
+    vector_store: VectorStore,
+    batch_size: Optional[int] = None,
+    cache: Optional[EmbeddingCache] = None,
+    ingested_files: Optional[IngestedFiles] = None,
+) -> int:
+    """Embed a group of chunked files together, then save each of them.
+
+    Saved files are recorded in ``ingested_files`` (if given) and their
+    chunks and vectors are released afterwards.
+
+    Parameters
+    ----------
+    contexts
+        Ingestion contexts with chunks set.
+    config
+        Configuration object.
+    embedding_model
+        Embedding model instance.
+    vector_store
+        Vector store instance.
+    batch_size
+        Number of chunks per embedding call. If None, it is probed on this
+        group's chunks when ``embedding.auto_batch_size`` is enabled, and
+        taken from ``embedding.batch_size`` otherwise.
+    cache
+        Optional embedding cache.
+    ingested_files
+        Optional record of ingested files.
+
+    Returns
+    -------
+    int
+        The batch size used, to pass on to the following groups.
+    """
+    logger = logging.getLogger()
+    if batch_size is None and config.embedding.auto_batch_size:
+        batch_size = find_optimal_embed_batch(
+            embedding_model,
+            [chunk.page_content for context in contexts for chunk in context.chunks],
+            max_bytes=config.embedding.auto_batch_max_bytes,
+        )
+        logger.info("Selected embedding batch size: %d", batch_size)
+    elif batch_size is None:
+        batch_size = config.embedding.batch_size
+
+    embed_files(contexts, config, embedding_model, batch_size, cache)
+
+    for context in contexts:
+        ingest_file(context, config, vector_store)
+        if ingested_files is not None:
+            ingested_files.record(context.file_path)
+        # Saved chunks and vectors are no longer needed; release them
+        # so memory shrinks as files are stored.
+        context.raw_text = None
+        context.chunks = []
+        context.vectors = []
+
+    return batch_size
+
+
+def ingest_settings_id(config: Config) -> str:
+    """Return an identifier of the settings that shape the stored chunks.
+
+    Files ingested under a different chunking method, chunk size, overlap or
+    embedding model are not skipped by ``vector_store.skip_ingested``.
+
+    Parameters
+    ----------
+    config
+        Configuration object.
+
+    Returns
+    -------
+    str
+        The chunker, chunking parameters and embedding model identifier.
+    """
+    return json.dumps(
+        {
+            "chunker": config.chunking.chunker_name.value,
+            "method": config.chunking.method,
+            "chunk_size": config.chunking.chunk_size,
+            "chunk_overlap": config.chunking.chunk_overlap,
+            "embedding": config.embedding.embed_name.value,
+            "model": config.embedding.get_model_id(),
+        },
+        sort_keys=True,
+    )
+
+
+def skip_ingested_files(
+    media_files: list[Path], ingested_files: IngestedFiles
+) -> list[Path]:
+    """Drop the files that were already ingested and have not changed since.
+
+    Parameters
+    ----------
+    media_files
+        Resolved input files.
+    ingested_files
+        Record of the files already stored in the collection.
+
+    Returns
+    -------
+    list[Path]
+        The new or changed files, in input order.
+    """
+    logger = logging.getLogger()
+    pending = [f for f in media_files if not ingested_files.is_unchanged(f)]
+    if len(pending) < len(media_files):
+        logger.info("Skipping %d already ingested file(s)", len(media_files) - len(pending))
+    return pending
+
+
+def ingest_file(
+    context: IngestionContext,
+    config: Config,
+    vector_store: VectorStore,
+) -> None:
+    """Store the embedded chunks of a loaded file using the pipeline pattern.
+
+    Parameters
+    ----------
+    context
+        Ingestion context with embedded chunks set.
+    config
+        Configuration object.
+    vector_store
+        Vector store instance.
+    """
+    logger = logging.getLogger()
+    logger.info(SEPARATOR_LINE)
+    logger.info("Ingesting: %s", context.file_path)
+    logger.info(SEPARATOR_LINE)
+
+    logger.info("Storing in vector database...")
+    logger.info("  Database location: %s", config.vector_store.persist_directory)
+    logger.info("  Collection: %s", config.vector_store.collection_name)
+
+    executor = PipelineExecutor([SaveStep(vector_store, persist=False)])
+    context = executor.execute(context)
+
+    if context.status == PipelineStatus.FAILED:
+        raise RuntimeError(f"Pipeline failed: {context.error}")
+
+    logger.info("\n%s", SEPARATOR_LINE)
+    logger.info("Ingestion Complete!")
+    logger.info(SEPARATOR_LINE)
+    logger.info("✓ File processed: %s", context.file_path.name)
+    if context.markdown_path:
+        logger.info("✓ Markdown file: %s", context.markdown_path)
+    logger.info("✓ Chunks created: %d", len(context.chunks))
+    logger.info("✓ Database location: %s", config.vector_store.persist_directory)
+    logger.info("✓ Collection: %s", config.vector_store.collection_name)
+    logger.info("%s\n", SEPARATOR_LINE)
+
+
+def create_ingest_components(config: Config) -> tuple[Embeddings, VectorStore, Chunker]:
+    """Create the embedding model, vector store and chunker used for ingestion.
+
+    Parameters
+    ----------
+    config
+        Configuration object.
+
+    Returns
+    -------
+    tuple
+        The embedding model, vector store and chunker.
+    """
+    embedding_model = EmbeddingModelFactory.create(
+        config.embedding.embed_name,
+        **(config.embedding.embed_config or {}),
+    )
+
+    vector_store = VectorStoreFactory.create(
+        config.vector_store.store_name,
+        persist_directory=str(config.vector_store.persist_directory),
+        collection_name=config.vector_store.collection_name,
+        embedding_function=embedding_model,
+        **(config.vector_store.store_config or {}),
+    )
+
     chunker_config = {
         "chunk_size": config.chunking.chunk_size,
         "chunk_overlap": config.chunking.chunk_overlap,
@@ -92,40 +401,79 @@ def ingest_file(
         **chunker_config,
     )
 
-    logger.info(
-        f"Chunking markdown (size={config.chunking.chunk_size}, "
-        f"overlap={config.chunking.chunk_overlap})..."
-    )
-    logger.info(f"Embedding chunks (model={config.embedding.embed_name})...")
-    logger.info("Storing in vector database...")
-    logger.info(f"  Database location: {config.vector_store.persist_directory}")
-    logger.info(f"  Collection: {config.vector_store.collection_name}")
+    return embedding_model, vector_store, chunker
 
-    context = IngestionContext(file_path=file_path)
 
-    steps = [
-        LoadStep(loader),
-        ChunkStep(chunker),
-        EmbeddingGenerationStep(embedding_model, config.embedding.embed_name),
-        SaveStep(vector_store),
-    ]
+def ingest_files(
+    loaded_contexts: Iterable[IngestionContext],
+    config: Config,
+    chunker: Chunker,
+    embedding_model: Embeddings,
+    vector_store: VectorStore,
+    cache: Optional[EmbeddingCache] = None,
+    ingested_files: Optional[IngestedFiles] = None,
+) -> None:
+    """Chunk, embed and save loaded files in groups as they arrive.
 
-    executor = PipelineExecutor(steps)
-    context = executor.execute(context)
+    Files are grouped until their Markdown is long enough to fill about
+    EMBED_GROUP_BATCHES embedding batches. Each group is chunked with a
+    single chunker call and embedded in batches that span file boundaries,
+    while the remaining files are still being loaded.
 
-    if context.status == PipelineStatus.FAILED:
-        raise RuntimeError(f"Pipeline failed: {context.error}")
+    The vector store is persisted, and the cache and ingested-file record
+    closed, once all files are saved or ingestion fails.
 
-    logger.info("\n" + SEPARATOR_CHAR * SEPARATOR_LENGTH)
-    logger.info("Ingestion Complete!")
-    logger.info(SEPARATOR_CHAR * SEPARATOR_LENGTH)
-    logger.info(f"✓ File processed: {file_path.name}")
-    if context.markdown_path:
-        logger.info(f"✓ Markdown file: {context.markdown_path}")
-    logger.info(f"✓ Chunks created: {len(context.chunks)}")
-    logger.info(f"✓ Database location: {config.vector_store.persist_directory}")
-    logger.info(f"✓ Collection: {config.vector_store.collection_name}")
-    logger.info(SEPARATOR_CHAR * SEPARATOR_LENGTH + "\n")
+    Parameters
+    ----------
+    loaded_contexts
+        Ingestion contexts with markdown_path and raw_text set, in input order.
+    config
+        Configuration object.
+    chunker
+        Chunker instance created by ChunkerFactory.
+    embedding_model
+        Embedding model instance.
+    vector_store
+        Vector store instance.
+    cache
+        Optional embedding cache.
+    ingested_files
+        Optional record of ingested files.
+    """
+    # Roughly the Markdown length that fills the group's embedding batches
+    chunk_step = max(config.chunking.chunk_size - config.chunking.chunk_overlap, 1)
+    max_group_chars = config.embedding.batch_size * EMBED_GROUP_BATCHES * chunk_step
+
+    # Probed on the first group when auto_batch_size is enabled, then reused
+    batch_size: Optional[int] = None
+    group: list[IngestionContext] = []
+    group_chars = 0
+    # Persist once for the whole run (also after a partial failure)
+    # instead of rewriting the store after every file.
+    try:
+        for context in loaded_contexts:
+            group.append(context)
+            group_chars += len(context.raw_text or "")
+            if group_chars >= max_group_chars:
+                chunk_files(group, chunker)
+                batch_size = embed_and_save_files(
+                    group, config, embedding_model, vector_store,
+                    batch_size, cache, ingested_files,
+                )
+                group, group_chars = [], 0
+
+        if group:
+            chunk_files(group, chunker)
+            embed_and_save_files(
+                group, config, embedding_model, vector_store,
+                batch_size, cache, ingested_files,
+            )
+    finally:
+        vector_store.persist()
+        if cache is not None:
+            cache.close()
+        if ingested_files is not None:
+            ingested_files.close()
 
 
 def main():
@@ -144,50 +492,70 @@ def main():
         logger.exception("\nUsage:")
         logger.exception("  python ingest.py ./data  # Ingest all supported files in directory")
         supported_types = ", ".join(SUPPORTED_FILE_EXTENSIONS)
-        logger.exception(f"\nSupported file types: {supported_types}")
+        logger.exception("\nSupported file types: %s", supported_types)
         logger.exception("\nConfiguration:")
         logger.exception("  - Config file: config.yaml or config.yml")
         logger.exception("  - Or set RAG_CONFIG_FILE=/path/to/config.yaml")
         logger.exception("  - Default paths are relative to current working directory")
         sys.exit(EXIT_CODE_ERROR)
 
-    logger.info(SEPARATOR_CHAR * SEPARATOR_LENGTH)
+    ingested_files = None
+    if config.vector_store.skip_ingested:
+        ingested_files = IngestedFiles(
+            config.vector_store.persist_directory / INGESTED_FILES_DB_NAME,
+            config.vector_store.collection_name,
+            ingest_settings_id(config),
+        )
+        media_files = skip_ingested_files(media_files, ingested_files)
+        if not media_files:
+            logger.info("✓ All files are already ingested.")
+            ingested_files.close()
+            return
+
+    logger.info(SEPARATOR_LINE)
     logger.info("RAG Media Ingestion Pipeline")
-    logger.info(SEPARATOR_CHAR * SEPARATOR_LENGTH)
-    logger.info(f"Inputs: {len(media_files)} file(s)")
-    logger.info(f"Database: {config.vector_store.persist_directory}")
-    logger.info(f"Collection: {config.vector_store.collection_name}")
+    logger.info(SEPARATOR_LINE)
+    logger.info("Inputs: %d file(s)", len(media_files))
+    logger.info("Database: %s", config.vector_store.persist_directory)
+    logger.info("Collection: %s", config.vector_store.collection_name)
     logger.info(
-        f"Chunk size: {config.chunking.chunk_size}, "
-        f"overlap: {config.chunking.chunk_overlap}"
+        "Chunk size: %d, overlap: %d",
+        config.chunking.chunk_size,
+        config.chunking.chunk_overlap,
     )
-    logger.info(f"Embedding model: {config.embedding.embed_name}")
+    logger.info("Embedding model: %s", config.embedding.embed_name)
     logger.info("")
 
+    # Markdown conversion is CPU-bound and independent per file, so files are
+    # loaded in worker processes. The pool is started, and every file
+    # submitted, before the embedding model and vector store are created:
+    # the workers do not fork with them in memory, and conversion overlaps
+    # model loading. Results arrive in input order while the workers keep
+    # converting.
+    pool = ProcessPoolExecutor(
+        max_workers=config.loader.get_max_workers(len(media_files)),
+        initializer=Logger.setup,
+        initargs=(config,),
+    )
     try:
-        embedding_model = EmbeddingModelFactory.create(
-            config.embedding.embed_name,
-            **(config.embedding.embed_config or {}),
-        )
+        loaded = pool.map(functools.partial(load_file, config=config), media_files)
 
-        vector_store = VectorStoreFactory.create(
-            config.vector_store.store_name,
-            persist_directory=str(config.vector_store.persist_directory),
-            collection_name=config.vector_store.collection_name,
-            embedding_function=embedding_model,
-            **(config.vector_store.store_config or {}),
+        embedding_model, vector_store, chunker = create_ingest_components(config)
+        ingest_files(
+            loaded, config, chunker, embedding_model, vector_store,
+            open_embedding_cache(config), ingested_files,
         )
 
-        for media_file in media_files:
-            ingest_file(media_file, config, embedding_model, vector_store)
-
         logger.info("✓ All files processed successfully.")
 
     except Exception as exc:
-        logger.error(f"\n✗ Error during ingestion: {exc}", exc_info=True)
+        # Report the error now rather than after converting the remaining files
+        pool.shutdown(cancel_futures=True)
+        logger.error("\n✗ Error during ingestion: %s", exc, exc_info=True)
         sys.exit(EXIT_CODE_ERROR)
 
+    pool.shutdown()
+
 
 if __name__ == "__main__":
     main()
-
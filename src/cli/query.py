@@ -1,25 +1,96 @@
 #!/usr/bin/env python3
 """Simple script to query the vector database with a question."""
 
+import json
 import logging
+import socket
 import sys
+from pathlib import Path
+from typing import Any, Optional
 
+import src.cli
 from src import Config
 from src.cli.constants import (
-    ALT_SEPARATOR_CHAR,
+    ALT_SEPARATOR_LINE,
     ENUMERATE_START,
     EXIT_CODE_ERROR,
     MAX_SCORE_DISTANCE,
     MIN_SCORE,
+    QUERY_SOCKET_ENCODING,
     SCORE_DECIMAL_PLACES,
-    SEPARATOR_CHAR,
-    SEPARATOR_LENGTH,
+    SEPARATOR_LINE,
 )
-from src.components import execute_query, initialize_rag_components
+from src.constants import DEFAULT_ENCODING
 from src.logger import Logger
 from src.pipeline import PipelineStatus
 
 
+def query_server(socket_path: Path, query: str) -> Optional[dict[str, Any]]:
+    """Send a query to a running query_server.py over its UNIX socket.
+
+    Returns
+    -------
+    dict or None
+        The query result, or None if no server is listening on the socket.
+    """
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(str(socket_path))
+    except (FileNotFoundError, ConnectionRefusedError):
+        client.close()
+        return None
+
+    with client, client.makefile("rwb") as stream:
+        request = json.dumps({"query": query}) + "\n"
+        stream.write(request.encode(QUERY_SOCKET_ENCODING))
+        stream.flush()
+        return json.loads(stream.readline().decode(QUERY_SOCKET_ENCODING))
+
+
+def format_report(result: dict[str, Any]) -> str:
+    """Format a query result as the multi-line report printed by this command."""
+    lines = [
+        "\n" + SEPARATOR_LINE,
+        "Final Answer",
+        SEPARATOR_LINE,
+        result["answer"] or "(no response)",
+    ]
+
+    if result["citations"]:
+        lines.append("\nSources:")
+        for c in result["citations"]:
+            cid = c.get("id")
+            source = c.get("source")
+            score = c.get("score")
+            lines.append(f"  [{cid}] {source}  distance={score}")
+
+    results_with_scores = result["retrieved"]
+
+    lines += [
+        "\n" + ALT_SEPARATOR_LINE,
+        f"Retrieved {len(results_with_scores)} chunks (debug):",
+        "Distance Score Guide (similarity_search_with_score):",
+        "  - Lower score = More similar to query",
+        f"  - Score range depends on the distance metric "
+        f"(often around {MIN_SCORE}-{MAX_SCORE_DISTANCE})",
+        "  - Closer to 0 = more similar",
+        ALT_SEPARATOR_LINE,
+    ]
+
+    for i, doc in enumerate(results_with_scores, ENUMERATE_START):
+        lines.append(f"\n[{i}] Distance Score: {doc['score']:.{SCORE_DECIMAL_PLACES}f}")
+        lines.append(f"    Content: {doc['content']}")
+        if doc["metadata"]:
+            lines.append(f"    Metadata: {doc['metadata']}")
+
+    lines += [
+        "\n" + SEPARATOR_LINE,
+        "Note: Lower distance scores indicate better matches to your query.",
+        SEPARATOR_LINE,
+    ]
+    return "\n".join(lines)
+
+
 def main():
     """Query the vector database with a question from command line arguments."""
     config = Config.get_config()
@@ -29,56 +100,31 @@ def main():
 
     query = " ".join(sys.argv[1:])
 
-    logger.info(SEPARATOR_CHAR * SEPARATOR_LENGTH)
+    logger.info(SEPARATOR_LINE)
     logger.info("Querying Vector Database")
-    logger.info(SEPARATOR_CHAR * SEPARATOR_LENGTH)
+    logger.info(SEPARATOR_LINE)
     logger.info(f"Query: {query}\n")
 
     try:
-        # Initialize RAG components
-        components = initialize_rag_components(config)
-
-        # Execute query using shared logic
-        context = execute_query(components, query)
-
-        if context.status == PipelineStatus.FAILED:
-            raise RuntimeError(f"Pipeline failed: {context.error}")
-
-        logger.info("\n" + SEPARATOR_CHAR * SEPARATOR_LENGTH)
-        logger.info("Final Answer")
-        logger.info(SEPARATOR_CHAR * SEPARATOR_LENGTH)
-        logger.info(context.llm_response or "(no response)")
-
-        if context.citations:
-            logger.info("\nSources:")
-            for c in context.citations:
-                cid = c.get("id")
-                source = c.get("source")
-                score = c.get("score")
-                logger.info(f"  [{cid}] {source}  distance={score}")
-
-        results_with_scores = context.retrieved_docs or []
-
-        logger.info("\n" + ALT_SEPARATOR_CHAR * SEPARATOR_LENGTH)
-        logger.info(f"Retrieved {len(results_with_scores)} chunks (debug):")
-        logger.info("Distance Score Guide (similarity_search_with_score):")
-        logger.info("  - Lower score = More similar to query")
-        logger.info(
-            f"  - Score range depends on the distance metric "
-            f"(often around {MIN_SCORE}-{MAX_SCORE_DISTANCE})"
-        )
-        logger.info("  - Closer to 0 = more similar")
-        logger.info(ALT_SEPARATOR_CHAR * SEPARATOR_LENGTH)
-
-        for i, (doc, score) in enumerate(results_with_scores, ENUMERATE_START):
-            logger.info(f"\n[{i}] Distance Score: {score:.{SCORE_DECIMAL_PLACES}f}")
-            logger.info(f"    Content: {doc.page_content}")
-            if doc.metadata:
-                logger.info(f"    Metadata: {doc.metadata}")
-
-        logger.info("\n" + SEPARATOR_CHAR * SEPARATOR_LENGTH)
-        logger.info("Note: Lower distance scores indicate better matches to your query.")
-        logger.info(SEPARATOR_CHAR * SEPARATOR_LENGTH)
+        result = None
+        if config.paths.query_socket:
+            result = query_server(config.paths.query_socket, query)
+            if result is None:
+                logger.info("No query server running, loading components locally")
+
+        if result is None:
+            # Lazy package attributes: the model libraries are only loaded
+            # here, never on the query server path
+            components = src.initialize_rag_components(config)
+            result = src.cli.answer_query(components, query)
+
+        if result["status"] == PipelineStatus.FAILED.value:
+            raise RuntimeError(f"Pipeline failed: {result['error']}")
+
+        # The report is output, not a log event: write it to stdout in one go
+        sys.stdout.flush()
+        sys.stdout.buffer.write((format_report(result) + "\n").encode(DEFAULT_ENCODING))
+        sys.stdout.buffer.flush()
 
     except Exception as e:
         logger.error(f"✗ Error: {e}", exc_info=True)
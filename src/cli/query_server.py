@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""Long-running query process that keeps the RAG components loaded.
+
+The RAG components (embedding model, vector store, retriever and LLM) are
+initialized once at startup and reused for every query, so only the first
+query pays the model-load cost.
+
+If ``paths.query_socket`` is set in config.yaml, queries are served over
+that UNIX socket (which query.py uses when it exists). Otherwise one query
+is read per stdin line. Either way, each answer is a single JSON line; logs
+go to stderr so stdout stays machine-readable.
+"""
+
+import json
+import logging
+import socketserver
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Optional
+
+from src import Config
+from src.cli.constants import EXIT_CODE_ERROR, QUERY_SOCKET_ENCODING
+from src.components import (
+    RAGComponents,
+    close_components,
+    execute_query,
+    initialize_rag_components,
+    warm_up_components,
+)
+from src.logger import Logger
+from src.pipeline import PipelineStatus
+
+
+def answer_query(components: RAGComponents, query: str) -> dict[str, Any]:
+    """Run a query and return its result as a JSON-serializable dict.
+
+    Parameters
+    ----------
+    components
+        Initialized RAG components.
+    query
+        User's question.
+
+    Returns
+    -------
+    dict
+        The query, pipeline status, answer, citations, retrieved chunks
+        (content, metadata and distance score) and error message, if any.
+    """
+    logger = logging.getLogger()
+    try:
+        context = execute_query(components, query)
+    except Exception as e:
+        logger.error(f"✗ Error: {e}", exc_info=True)
+        return error_result(query, str(e))
+
+    return {
+        "query": query,
+        "status": context.status.value,
+        "answer": context.llm_response,
+        "citations": context.citations or [],
+        "retrieved": [
+            {"content": doc.page_content, "metadata": doc.metadata, "score": score}
+            for doc, score in context.retrieved_docs or []
+        ],
+        "error": context.error,
+    }
+
+
+def error_result(query: Optional[str], error: str) -> dict[str, Any]:
+    """Return a failed query result carrying an error message.
+
+    Parameters
+    ----------
+    query
+        User's question, or None if the request could not be read.
+    error
+        Error message.
+
+    Returns
+    -------
+    dict
+        A result with the same keys as answer_query, status "failed" and
+        no answer.
+    """
+    return {
+        "query": query,
+        "status": PipelineStatus.FAILED.value,
+        "answer": None,
+        "citations": [],
+        "retrieved": [],
+        "error": error,
+    }
+
+
+def encode_result(result: dict[str, Any]) -> str:
+    """Serialize a query result as one JSON line."""
+    return json.dumps(result, default=str) + "\n"
+
+
+class _QueryHandler(socketserver.StreamRequestHandler):
+    """Answer one JSON line ``{"query": ...}`` per connection.
+
+    Malformed requests are answered with an error result instead of
+    dropping the connection.
+    """
+
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        try:
+            request = json.loads(line.decode(QUERY_SOCKET_ENCODING))
+        except ValueError as e:  # also covers JSON and Unicode decode errors
+            request, error = None, f"Invalid request, expected a JSON line: {e}"
+        else:
+            error = 'Invalid request, expected {"query": "<text>"}'
+
+        query = request.get("query") if isinstance(request, dict) else None
+        if isinstance(query, str):
+            result = answer_query(self.server.components, query)
+        else:
+            logging.getLogger().warning("Rejected query request: %s", error)
+            result = error_result(None, error)
+        self.wfile.write(encode_result(result).encode(QUERY_SOCKET_ENCODING))
+
+
+def serve_socket(components: RAGComponents, socket_path: Path) -> None:
+    """Serve queries over a UNIX socket until interrupted.
+
+    Each connection is handled in its own thread, so concurrent queries
+    share the loaded components.
+    """
+    logger = logging.getLogger()
+    socket_path.unlink(missing_ok=True)
+    with socketserver.ThreadingUnixStreamServer(str(socket_path), _QueryHandler) as server:
+        server.components = components
+        logger.info(f"Listening for queries on {socket_path}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            socket_path.unlink(missing_ok=True)
+
+
+def serve_stdin(components: RAGComponents) -> None:
+    """Answer one query per stdin line until EOF."""
+    logger = logging.getLogger()
+    logger.info("Ready for queries (one per line, Ctrl-D to exit)")
+
+    for line in sys.stdin:
+        query = line.strip()
+        if not query:
+            continue
+        sys.stdout.write(encode_result(answer_query(components, query)))
+        sys.stdout.flush()
+
+
+def main():
+    """Initialize the RAG components once and serve queries."""
+    config = Config.get_config()
+
+    Logger.setup(config, stream=sys.stderr)
+    logger = logging.getLogger()
+
+    try:
+        components = initialize_rag_components(config)
+    except Exception as e:
+        logger.error(f"✗ Error: {e}", exc_info=True)
+        sys.exit(EXIT_CODE_ERROR)
+
+    threading.Thread(target=warm_up_components, args=(components,), daemon=True).start()
+
+    try:
+        if config.paths.query_socket:
+            serve_socket(components, config.paths.query_socket)
+        else:
+            serve_stdin(components)
+    finally:
+        close_components(components)
+
+
+if __name__ == "__main__":
+    main()
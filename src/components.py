@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+from contextlib import nullcontext
 from pathlib import Path
 from typing import NamedTuple
 
@@ -12,10 +13,15 @@ from . import (
     RetrieverFactory,
     VectorStoreFactory,
 )
+from .constants import WARMUP_QUERY
+from .embeddings.batching import BatchingEmbeddings
+from .embeddings.cache import CachedEmbeddings, EmbeddingCache
+from .embeddings.constants import QUERY_EMBEDDING_CACHE_MODEL_SUFFIX
 from .embeddings.protocol import Embeddings
 from .llms.protocol import LLM
 from .pipeline import PipelineExecutor, QueryContext
 from .pipeline.steps import GenerationStep, QueryEmbeddingStep, RetrieveStep
+from .retrievers.locked_retriever import LockedRetriever
 from .retrievers.protocol import Retriever
 from .vector_stores.protocol import VectorStore
 
@@ -27,6 +33,7 @@ class RAGComponents(NamedTuple):
     vector_store: VectorStore
     retriever: Retriever
     llm: LLM
+    query_executor: PipelineExecutor
 
 
 def initialize_rag_components(config: Config | None = None) -> RAGComponents:
@@ -60,6 +67,28 @@ def initialize_rag_components(config: Config | None = None) -> RAGComponents:
         config.embedding.embed_name,
         **(config.embedding.embed_config or {}),
     )
+    if config.embedding.query_max_batch_size:
+        embedding_model = BatchingEmbeddings(
+            embedding_model,
+            max_batch_size=config.embedding.query_max_batch_size,
+            max_wait=config.embedding.query_batch_wait_ms / 1000,
+        )
+
+    # Repeated queries (and the vector store re-embedding the query the
+    # embedding step already embedded) reuse the cached vector
+    query_cache = None
+    if config.embedding.cache_path:
+        query_cache = EmbeddingCache(
+            config.embedding.cache_path,
+            provider=config.embedding.embed_name.value,
+            model=config.embedding.get_model_id() + QUERY_EMBEDDING_CACHE_MODEL_SUFFIX,
+            fuzzy=config.embedding.cache_fuzzy,
+        )
+    embedding_model = CachedEmbeddings(
+        embedding_model,
+        query_cache,
+        symmetric=config.embedding.symmetric_queries,
+    )
 
     vector_store = VectorStoreFactory.create(
         config.vector_store.store_name,
@@ -73,16 +102,26 @@ def initialize_rag_components(config: Config | None = None) -> RAGComponents:
     if config.retrieval.searcher_config:
         retriever_kwargs.update(config.retrieval.searcher_config)
 
-    retriever = RetrieverFactory.create(
+    # Servers share these components across request threads; the vector
+    # store is only searched by one of them at a time
+    retriever = LockedRetriever(RetrieverFactory.create(
         config.retrieval.searcher_strategy,
         **retriever_kwargs,
-    )
+    ))
 
     llm = LLMFactory.create(
         config.llm.llm_name,
         **(config.llm.llm_config or {}),
     )
 
+    # The query steps only hold references to the components, so one
+    # executor is built here and shared by every query
+    query_executor = PipelineExecutor([
+        QueryEmbeddingStep(embedding_model),
+        RetrieveStep(retriever),
+        GenerationStep(llm),
+    ])
+
     logger.info("RAG components initialized successfully")
 
     return RAGComponents(
@@ -90,9 +129,58 @@ def initialize_rag_components(config: Config | None = None) -> RAGComponents:
         vector_store=vector_store,
         retriever=retriever,
         llm=llm,
+        query_executor=query_executor,
     )
 
 
+def warm_up_components(components: RAGComponents) -> None:
+    """Run one embedding and one vector search so the first real query is fast
+
+    Loads the embedding model's weights and kernels and pages in the
+    vector store index. The warm-up query is embedded with the wrapped
+    model directly, so it is never written to the query embedding cache.
+    Meant for long-running servers, typically in a background thread right
+    after initialize_rag_components; errors are logged and otherwise ignored.
+
+    Parameters
+    ----------
+    components : RAGComponents
+        Initialized RAG components
+    """
+    logger = logging.getLogger()
+    embedding_model = components.embedding_model
+    if isinstance(embedding_model, CachedEmbeddings):
+        embedding_model = embedding_model.embedding_model
+    try:
+        vector = embedding_model.embed_query(WARMUP_QUERY)
+        # Searching by vector keeps the query cache out of the warm-up;
+        # stores without it only get the model warmed up
+        search_by_vector = getattr(components.vector_store, "similarity_search_by_vector", None)
+        if search_by_vector is not None:
+            with getattr(components.retriever, "lock", None) or nullcontext():
+                search_by_vector(vector, k=1)
+    except Exception as e:
+        logger.warning("Warm-up failed: %s", e)
+        return
+    logger.info("RAG components warmed up")
+
+
+def close_components(components: RAGComponents) -> None:
+    """Release the resources held by the RAG components
+
+    Stops the query batching worker and closes the persistent query
+    embedding cache, if either is enabled.
+
+    Parameters
+    ----------
+    components : RAGComponents
+        Initialized RAG components
+    """
+    close = getattr(components.embedding_model, "close", None)
+    if close is not None:
+        close()
+
+
 def execute_query(components: RAGComponents, query: str) -> QueryContext:
     """Execute a RAG query using the provided components
 
@@ -109,17 +197,33 @@ def execute_query(components: RAGComponents, query: str) -> QueryContext:
         Pipeline context containing the query results
     """
     logger = logging.getLogger()
-    logger.info(f"Executing query: {query}")
+    logger.info("Executing query: %s", query)
 
     context = QueryContext(user_query=query)
+    return components.query_executor.execute(context)
+
+
+def execute_queries(components: RAGComponents, queries: list[str]) -> list[QueryContext]:
+    """Execute several RAG queries, embedding them up front
 
-    steps = [
-        QueryEmbeddingStep(components.embedding_model),
-        RetrieveStep(components.retriever),
-        GenerationStep(components.llm),
-    ]
+    The queries are embedded before the pipeline runs (in a single
+    embedding model call if ``embedding.symmetric_queries`` is set), so each
+    query's embedding step (and the vector store's own query embedding) is
+    a cache hit.
 
-    executor = PipelineExecutor(steps)
-    context = executor.execute(context)
+    Parameters
+    ----------
+    components : RAGComponents
+        Initialized RAG components
+    queries : list[str]
+        User questions or query texts
+
+    Returns
+    -------
+    list[QueryContext]
+        Pipeline contexts containing each query's results, in input order
+    """
+    if isinstance(components.embedding_model, CachedEmbeddings):
+        components.embedding_model.embed_queries(queries)
 
-    return context
+    return [execute_query(components, query) for query in queries]
@@ -1,5 +1,6 @@
 """Main configuration class combining all sub-configurations."""
 
+import functools
 import threading
 from pathlib import Path
 from typing import Optional
@@ -9,7 +10,7 @@ from pydantic import Field
 from pydantic_settings import BaseSettings
 
 from .chunking import ChunkingConfig
-from .constants import CONFIG_FILE_NAME
+from .constants import CONFIG_CACHE_SIZE, CONFIG_FILE_NAME
 from .embedding import EmbeddingConfig
 from .loader import LoaderConfig
 from .logging import LoggingConfig
@@ -18,6 +19,9 @@ from .retrieval import RetrievalConfig
 from .vector_store import VectorStoreConfig
 from .llm import LLMConfig
 
+# libyaml's C parser when PyYAML was built with it, else the pure-Python one
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class Config(BaseSettings):
     """Main configuration class combining all sub-configurations."""
@@ -34,7 +38,10 @@ class Config(BaseSettings):
     @classmethod
     def from_file(cls, config_path: Path) -> "Config":
         """Load configuration from a YAML file."""
-        config_path = Path(config_path).expanduser().resolve()
+        config_path = Path(config_path)
+        # get_config passes an absolute path; only relative or ~ paths need resolving
+        if not config_path.is_absolute():
+            config_path = config_path.expanduser().resolve()
 
         if not config_path.exists():
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
@@ -43,36 +50,51 @@ class Config(BaseSettings):
             raise ValueError(f"Configuration file must be YAML (.yaml), got: {config_path.suffix}")
 
         with config_path.open() as f:
-            data = yaml.safe_load(f) or {}
+            data = yaml.load(f, Loader=_YAML_LOADER) or {}
 
         return cls(**data)
 
     @staticmethod
     def get_config() -> "Config":
-        """Get the global configuration instance (thread-safe singleton pattern).
+        """Get the global configuration instance (thread-safe).
 
-        The configuration is loaded once from config.yaml
-        and cached for subsequent calls. If the config file doesn't exist,
-        uses default values.
+        The configuration is loaded from config.yaml and cached for
+        subsequent calls; it is only reloaded when the file's modification
+        time changes. If the config file doesn't exist, uses default values.
 
         This method is thread-safe and ensures that only one instance
-        is created even when called concurrently from multiple threads.
+        is created per file version even when called concurrently from
+        multiple threads.
 
         Returns
         -------
         Config
-            The global configuration instance (same instance on subsequent calls).
+            The global configuration instance (same instance on subsequent
+            calls while config.yaml is unchanged).
         """
-        global _config, _config_lock
+        # absolute() only prepends the working directory; resolve() would walk
+        # the path for symlinks on every call. The file is resolved by
+        # from_file when it is (re)loaded.
+        config_path = Path(CONFIG_FILE_NAME).absolute()
+        try:
+            mtime_ns = config_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime_ns = None
+
+        with _config_lock:
+            return _load_config(str(config_path), mtime_ns)
+
+
+@functools.lru_cache(maxsize=CONFIG_CACHE_SIZE)
+def _load_config(config_path: str, mtime_ns: Optional[int]) -> Config:
+    """Load the configuration file (or the defaults if it is missing).
 
-        if _config is None:
-            with _config_lock:
-                if _config is None:
-                    config_path = Path(CONFIG_FILE_NAME)
-                    _config = Config.from_file(config_path) if config_path.exists() else Config()
+    Cached per path and modification time, so an unchanged file is parsed
+    and validated only once.
+    """
+    if mtime_ns is None:
+        return Config()
+    return Config.from_file(Path(config_path))
 
-        return _config
 
-# Global configuration instance (thread-safe singleton pattern)
-_config: Optional[Config] = None
 _config_lock = threading.Lock()
@@ -2,3 +2,5 @@
 
 CONFIG_FILE_NAME = "config.yaml"
 
+# Parsed configurations kept per (config file path, modification time)
+CONFIG_CACHE_SIZE = 4
@@ -1,12 +1,24 @@
 """Embedding model configuration."""
 
+import hashlib
+import json
+from pathlib import Path
 from typing import Optional
 
-from pydantic import Field
+from pydantic import Field, model_validator
 from pydantic_settings import BaseSettings
 
+from src.embeddings.constants import (
+    DEFAULT_EMBEDDING_BATCH_SIZE,
+    DEFAULT_QUERY_BATCH_WAIT_MS,
+    DEFAULT_REMOTE_EMBEDDING_CONCURRENCY,
+    EMBED_CONFIG_DIGEST_LENGTH,
+)
 from src.embeddings.types import EmbeddingModelType
 
+# Providers whose embed_documents calls are network requests to an API
+_REMOTE_EMBEDDING_MODELS = frozenset({EmbeddingModelType.OPENAI})
+
 
 class EmbeddingConfig(BaseSettings):
     """Embedding model configuration."""
@@ -19,4 +31,110 @@ class EmbeddingConfig(BaseSettings):
         default=None,
         description="Additional model-specific keyword arguments",
     )
+    batch_size: int = Field(
+        default=DEFAULT_EMBEDDING_BATCH_SIZE,
+        description="Number of chunks sent to the embedding model per call",
+        gt=0,
+    )
+    max_concurrent_requests: Optional[int] = Field(
+        default=None,
+        description=(
+            "Number of batches embedded concurrently during ingestion "
+            "(default: 8 for API providers, 1 for local models)"
+        ),
+        gt=0,
+    )
+    auto_batch_size: bool = Field(
+        default=False,
+        description="Probe the embedding model at startup and use the fastest batch size instead of batch_size",
+    )
+    auto_batch_max_bytes: Optional[int] = Field(
+        default=None,
+        description="Memory budget in bytes for batch size probing (unchecked if unset)",
+        gt=0,
+    )
+    cache_path: Optional[Path] = Field(
+        default=None,
+        description=(
+            "SQLite file caching embeddings by chunk text, provider and model "
+            "(disabled if unset)"
+        ),
+    )
+    cache_fuzzy: bool = Field(
+        default=False,
+        description=(
+            "Reuse cached embeddings for texts that only differ in whitespace"
+        ),
+    )
+    symmetric_queries: bool = Field(
+        default=False,
+        description=(
+            "The model embeds queries exactly like documents (no query prefix or "
+            "instruction), so several queries may share one embed_documents call"
+        ),
+    )
+    query_max_batch_size: Optional[int] = Field(
+        default=None,
+        description=(
+            "Coalesce concurrent query embeddings into batches of up to this size "
+            "(disabled if unset)"
+        ),
+        gt=0,
+    )
+    query_batch_wait_ms: float = Field(
+        default=DEFAULT_QUERY_BATCH_WAIT_MS,
+        description="Milliseconds to wait for more queries before embedding a batch",
+        ge=0,
+    )
+
+    @model_validator(mode='after')
+    def validate_query_batching_is_symmetric(self) -> 'EmbeddingConfig':
+        # Batched queries are embedded with embed_documents, which skips the
+        # query prefix or instruction of asymmetric models
+        if self.query_max_batch_size and not self.symmetric_queries:
+            raise ValueError(
+                "query_max_batch_size requires symmetric_queries: only models "
+                "that embed queries like documents can batch queries"
+            )
+        return self
+
+    def get_max_concurrent_requests(self) -> int:
+        """Return how many embedding batches may be in flight at once.
+
+        Returns
+        -------
+        int
+            max_concurrent_requests if set, otherwise
+            DEFAULT_REMOTE_EMBEDDING_CONCURRENCY for API providers and 1 for
+            local models (which would only compete for the same CPU/GPU).
+        """
+        if self.max_concurrent_requests:
+            return self.max_concurrent_requests
+        if self.embed_name in _REMOTE_EMBEDDING_MODELS:
+            return DEFAULT_REMOTE_EMBEDDING_CONCURRENCY
+        return 1
+
+    def get_model_id(self) -> str:
+        """Return the model identifier within the provider, used as the cache key.
+
+        The identifier includes a digest of embed_config, so options that
+        change the vectors (precision, backend, max_seq_length,
+        encode_kwargs, ...) get their own cache entries. API keys are left
+        out of the digest so rotating them keeps the cache.
 
+        Returns
+        -------
+        str
+            The model name from embed_config ('model_name' or 'model'), or
+            "default" when the provider default is used, followed by "@" and
+            the embed_config digest.
+        """
+        embed_config = self.embed_config or {}
+        model_name = embed_config.get("model_name") or embed_config.get("model") or "default"
+        options = {
+            key: value for key, value in embed_config.items() if "api_key" not in key
+        }
+        digest = hashlib.sha256(
+            json.dumps(options, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+        return f"{model_name}@{digest[:EMBED_CONFIG_DIGEST_LENGTH]}"
@@ -1,5 +1,6 @@
 """Document loader configuration."""
 
+import os
 from typing import Any, Optional
 
 from pydantic import Field
@@ -28,4 +29,28 @@ class LoaderConfig(BaseSettings):
             "Format: {'.pdf': {'loader_name': 'pymupdf', 'loader_config': {...}}, ...}"
         ),
     )
+    max_workers: Optional[int] = Field(
+        default=None,
+        description=(
+            "Number of worker processes converting files to Markdown "
+            "(default: CPU count - 1)"
+        ),
+        gt=0,
+    )
 
+    def get_max_workers(self, num_files: int) -> int:
+        """Return the number of loader processes to start for a run.
+
+        Parameters
+        ----------
+        num_files
+            Number of files to load.
+
+        Returns
+        -------
+        int
+            max_workers (or CPU count - 1 if unset), capped at the number of files
+            so no idle worker processes are started.
+        """
+        workers = self.max_workers or max(1, (os.cpu_count() or 2) - 1)
+        return max(1, min(workers, num_files))
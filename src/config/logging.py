@@ -5,6 +5,14 @@ import logging
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
+_LEVEL_MAP = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
 
 class LoggingConfig(BaseSettings):
     """Logging configuration."""
@@ -22,15 +30,5 @@ class LoggingConfig(BaseSettings):
         int
             Logging level constant.
         """
-        level_map = {
-            "DEBUG": logging.DEBUG,
-            "INFO": logging.INFO,
-            "WARNING": logging.WARNING,
-            "ERROR": logging.ERROR,
-            "CRITICAL": logging.CRITICAL,
-        }
-        level_upper = self.level.upper()
-        if level_upper not in level_map:
-            return logging.INFO  # Default fallback
-        return level_map[level_upper]
+        return _LEVEL_MAP.get(self.level.upper(), logging.INFO)  # INFO as fallback
 
@@ -1,6 +1,7 @@
 """File paths configuration."""
 
 from pathlib import Path
+from typing import Optional
 
 from pydantic import Field
 from pydantic_settings import BaseSettings
@@ -18,3 +19,10 @@ class PathsConfig(BaseSettings):
         description="Directory for markdown output (relative to current working directory)",
     )
 
+    query_socket: Optional[Path] = Field(
+        default=None,
+        description=(
+            "UNIX socket served by query_server.py and used by query.py when present "
+            "(disabled if unset)"
+        ),
+    )
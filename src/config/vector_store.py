@@ -32,4 +32,11 @@ class VectorStoreConfig(BaseSettings):
         default=None,
         description="Additional store-specific configuration",
     )
+    skip_ingested: bool = Field(
+        default=False,
+        description=(
+            "Skip input files already ingested into the collection and unchanged since "
+            "(files ingested with other chunking settings or embedding model are re-ingested)"
+        ),
+    )
 
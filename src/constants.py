@@ -9,3 +9,6 @@ DEFAULT_ENCODING = "utf-8"
 
 DEFAULT_RETRIEVAL_K = 5
 
+
+# Query sent by warm_up_components to load models and page in the index
+WARMUP_QUERY = "warmup"
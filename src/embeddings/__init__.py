@@ -1,8 +1,12 @@
 """Embedding implementations."""
 
-from .factory import EmbeddingModelFactory
+from ..lazy_imports import lazy_getattr
 from .protocol import Embeddings
 from .types import EmbeddingModelType
 
-__all__ = ["EmbeddingModelFactory", "EmbeddingModelType", "Embeddings"]
+# Imported on first access; they pull in LangChain and model libraries.
+__getattr__ = lazy_getattr(__name__, {
+    "EmbeddingModelFactory": ".factory",
+})
 
+__all__ = ["EmbeddingModelFactory", "EmbeddingModelType", "Embeddings"]
@@ -0,0 +1,103 @@
+"""Pick an embedding batch size by probing the embedding model."""
+from __future__ import annotations
+
+import logging
+import sys
+import time
+import tracemalloc
+from collections.abc import Sequence
+from typing import Any, Optional
+
+from .constants import DEFAULT_EMBEDDING_BATCH_SIZE, EMBEDDING_BATCH_PROBE_SIZES
+from .protocol import Embeddings
+
+
+def find_optimal_embed_batch(
+    embedding_model: Embeddings,
+    sample_texts: list[str],
+    max_bytes: Optional[int] = None,
+    candidates: Sequence[int] = EMBEDDING_BATCH_PROBE_SIZES,
+) -> int:
+    """Return the candidate batch size with the highest embedding throughput.
+
+    Each candidate is timed with one embed_documents call on the longest
+    sample texts, so the probe reflects the most memory-hungry batches.
+    Probing stops at the first candidate that is larger than the sample or
+    whose peak memory growth during the call exceeds half of ``max_bytes``.
+
+    Memory is measured per call: on the GPU with torch.cuda when PyTorch is
+    loaded and CUDA is available, otherwise with tracemalloc (Python and
+    NumPy allocations). Tracing only runs when ``max_bytes`` is given.
+
+    Parameters
+    ----------
+    embedding_model
+        Embedding model instance created by EmbeddingModelFactory.
+    sample_texts
+        Texts to probe with (typically the chunks about to be embedded).
+    max_bytes
+        Optional memory budget in bytes. If None, memory is not checked.
+    candidates
+        Batch sizes to probe, in increasing order.
+
+    Returns
+    -------
+    The selected batch size, or DEFAULT_EMBEDDING_BATCH_SIZE if no
+    candidate could be probed.
+    """
+    logger = logging.getLogger()
+    probe_texts = sorted(sample_texts, key=len, reverse=True)
+
+    cuda = _cuda() if max_bytes is not None else None
+    start_tracing = max_bytes is not None and cuda is None and not tracemalloc.is_tracing()
+    if start_tracing:
+        tracemalloc.start()
+
+    best_size, best_rate = None, 0.0
+    try:
+        for size in candidates:
+            if size > len(probe_texts):
+                break
+
+            baseline = _reset_peak_memory(cuda) if max_bytes is not None else 0
+            start = time.perf_counter()
+            embedding_model.embed_documents(probe_texts[:size])
+            elapsed = time.perf_counter() - start
+
+            if max_bytes is not None and _peak_memory(cuda) - baseline > max_bytes * 0.5:
+                logger.info("Batch size %d exceeds the memory budget, stopping probe", size)
+                break
+
+            rate = size / elapsed if elapsed > 0 else float("inf")
+            logger.info("Batch size %d: %.1f chunks/s", size, rate)
+            if rate > best_rate:
+                best_size, best_rate = size, rate
+    finally:
+        if start_tracing:
+            tracemalloc.stop()
+
+    return best_size or DEFAULT_EMBEDDING_BATCH_SIZE
+
+
+def _cuda() -> Optional[Any]:
+    """Return torch.cuda if PyTorch is already loaded and a GPU is available."""
+    torch = sys.modules.get("torch")
+    if torch is not None and torch.cuda.is_available():
+        return torch.cuda
+    return None
+
+
+def _reset_peak_memory(cuda: Optional[Any]) -> int:
+    """Reset the peak memory counter and return the current allocation in bytes."""
+    if cuda is not None:
+        cuda.reset_peak_memory_stats()
+        return cuda.memory_allocated()
+    tracemalloc.reset_peak()
+    return tracemalloc.get_traced_memory()[0]
+
+
+def _peak_memory(cuda: Optional[Any]) -> int:
+    """Return the peak allocation in bytes since the last reset."""
+    if cuda is not None:
+        return cuda.max_memory_allocated()
+    return tracemalloc.get_traced_memory()[1]
@@ -0,0 +1,108 @@
+"""Coalesce concurrent query embeddings into batched model calls."""
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+from .protocol import Embeddings
+
+
+class BatchingEmbeddings:
+    """Embeddings wrapper that micro-batches concurrent embed_query calls.
+
+    Each embed_query call is queued and blocks until a background worker
+    has embedded it. The worker waits up to ``max_wait`` seconds after the
+    first queued query for more queries to arrive, then embeds up to
+    ``max_batch_size`` of them with a single embed_documents call, so
+    concurrent requests share one encoder forward pass.
+
+    embed_documents calls are passed through unchanged. Queries are embedded
+    with embed_documents, so this wrapper is only suitable for models that
+    embed queries and documents the same way (EmbeddingConfig only allows
+    query_max_batch_size together with symmetric_queries). Call close() to
+    stop the worker.
+    """
+
+    def __init__(self, embedding_model: Embeddings, max_batch_size: int, max_wait: float):
+        """Wrap an embedding model and start the batching worker.
+
+        Parameters
+        ----------
+        embedding_model
+            Embedding model instance created by EmbeddingModelFactory.
+        max_batch_size
+            Maximum number of queries embedded per call.
+        max_wait
+            Seconds to wait for more queries after the first one arrives.
+        """
+        self.embedding_model = embedding_model
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+
+        # None is the stop sentinel queued by close()
+        self._queue: queue.Queue[tuple[str, Future] | None] = queue.Queue()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._worker = threading.Thread(
+            target=self._run, name="query-embedding-batcher", daemon=True
+        )
+        self._worker.start()
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        """Embed a list of documents with the wrapped model."""
+        return self.embedding_model.embed_documents(texts)
+
+    def embed_query(self, text: str) -> list[float]:
+        """Embed a single query, batched with any concurrent queries."""
+        future: Future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("BatchingEmbeddings is closed")
+            self._queue.put((text, future))
+        return future.result()
+
+    def close(self) -> None:
+        """Embed the queries already queued, then stop the worker thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(None)
+        self._worker.join()
+
+    def _run(self) -> None:
+        """Drain the queue into batches until close() is called."""
+        logger = logging.getLogger()
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is None:
+                break
+            batch = [item]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            logger.debug("Embedding %d queries in one batch", len(batch))
+            try:
+                vectors = self.embedding_model.embed_documents([text for text, _ in batch])
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+
+            for (_, future), vector in zip(batch, vectors):
+                future.set_result(vector)
@@ -0,0 +1,265 @@
+"""Persistent embedding cache keyed by chunk content, provider and model."""
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+import sqlite3
+import threading
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Union
+
+from .constants import EMBEDDING_CACHE_LOOKUP_BATCH_SIZE, QUERY_EMBEDDING_CACHE_SIZE
+from .protocol import Embeddings
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+class EmbeddingCache:
+    """SQLite-backed store of embedding vectors for previously seen texts.
+
+    Entries are keyed by the SHA-256 of the text together with the embedding
+    provider and model, so switching models never returns stale vectors
+    (EmbeddingConfig.get_model_id also folds the model options into the
+    model key).
+    Vectors are stored as float32 blobs.
+
+    With ``fuzzy=True``, texts without an exact match fall back to a match on
+    their normalized form (whitespace collapsed), so trivial edits such as
+    re-wrapped lines reuse the existing vector. Case is kept: embeddings are
+    case-sensitive.
+
+    The connection may be used from any thread, but not concurrently;
+    callers sharing a cache across threads must serialize access.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        provider: str,
+        model: str,
+        fuzzy: bool = False,
+    ):
+        """Open (or create) the cache database.
+
+        Parameters
+        ----------
+        path
+            Path to the SQLite database file.
+        provider
+            Embedding provider name (e.g. "huggingface").
+        model
+            Embedding model identifier within the provider.
+        fuzzy
+            Whether to fall back to normalized-text matches on exact misses.
+        """
+        self.path = Path(path).expanduser()
+        self.provider = provider
+        self.model = model
+        self.fuzzy = fuzzy
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embedding_cache ("
+            "hash TEXT, provider TEXT, model TEXT, normalized_hash TEXT, vector BLOB, "
+            "PRIMARY KEY (hash, provider, model))"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS embedding_cache_normalized "
+            "ON embedding_cache (normalized_hash, provider, model)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def hash_text(text: str) -> str:
+        """Return the exact cache key for a text."""
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def normalized_hash(text: str) -> str:
+        """Return the fuzzy cache key for a text (whitespace collapsed)."""
+        normalized = _WHITESPACE_RE.sub(" ", text.strip())
+        return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+    def lookup(self, texts: list[str]) -> dict[str, list[float]]:
+        """Return cached vectors keyed by each text's exact hash (misses are omitted)."""
+        hashes = [self.hash_text(text) for text in texts]
+        found = self._select("hash", hashes)
+
+        if self.fuzzy:
+            misses = {h: text for h, text in zip(hashes, texts) if h not in found}
+            normalized = {h: self.normalized_hash(text) for h, text in misses.items()}
+            fuzzy_found = self._select("normalized_hash", list(normalized.values()))
+            for text_hash, key in normalized.items():
+                if key in fuzzy_found:
+                    found[text_hash] = fuzzy_found[key]
+        return found
+
+    def write(self, items: dict[str, list[float]]) -> None:
+        """Insert or replace vectors keyed by text."""
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO embedding_cache "
+            "(hash, provider, model, normalized_hash, vector) VALUES (?, ?, ?, ?, ?)",
+            [
+                (
+                    self.hash_text(text),
+                    self.provider,
+                    self.model,
+                    self.normalized_hash(text),
+                    _encode_vector(vector),
+                )
+                for text, vector in items.items()
+            ],
+        )
+        self._conn.commit()
+
+    def _select(self, column: str, keys: list[str]) -> dict[str, list[float]]:
+        """Return vectors whose ``column`` value is in ``keys``, keyed by that value."""
+        unique = list(dict.fromkeys(keys))
+        found: dict[str, list[float]] = {}
+        for start in range(0, len(unique), EMBEDDING_CACHE_LOOKUP_BATCH_SIZE):
+            batch = unique[start:start + EMBEDDING_CACHE_LOOKUP_BATCH_SIZE]
+            placeholders = ", ".join("?" * len(batch))
+            rows = self._conn.execute(
+                f"SELECT {column}, vector FROM embedding_cache "
+                f"WHERE provider = ? AND model = ? AND {column} IN ({placeholders})",
+                [self.provider, self.model, *batch],
+            )
+            for key, blob in rows:
+                found[key] = _decode_vector(blob)
+        return found
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+
+class CachedEmbeddings:
+    """Embeddings wrapper that memoizes query embeddings.
+
+    Query vectors are kept in an in-memory LRU of ``maxsize`` entries and,
+    if a persistent ``cache`` is given, stored there too so they survive
+    restarts. embed_documents calls are passed through unchanged (document
+    embeddings are cached by EmbeddingGenerationStep).
+    """
+
+    def __init__(
+        self,
+        embedding_model: Embeddings,
+        cache: Optional[EmbeddingCache] = None,
+        maxsize: int = QUERY_EMBEDDING_CACHE_SIZE,
+        symmetric: bool = False,
+    ):
+        """Wrap an embedding model.
+
+        Parameters
+        ----------
+        embedding_model
+            Embedding model instance created by EmbeddingModelFactory.
+        cache
+            Optional persistent cache for query vectors. It should use a
+            model key distinct from the one used for document embeddings.
+        maxsize
+            Maximum number of query vectors kept in memory.
+        symmetric
+            Whether the model embeds queries exactly like documents. Only then
+            are several uncached queries embedded in one embed_documents call;
+            otherwise each goes through embed_query, which may add a query
+            prefix or instruction.
+        """
+        self.embedding_model = embedding_model
+        self.cache = cache
+        self.maxsize = maxsize
+        self.symmetric = symmetric
+        self._memory: OrderedDict[str, list[float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        """Embed a list of documents with the wrapped model."""
+        return self.embedding_model.embed_documents(texts)
+
+    def embed_query(self, text: str) -> list[float]:
+        """Embed a single query, reusing the vector of an identical earlier query."""
+        return self.embed_queries([text])[0]
+
+    def embed_queries(self, texts: list[str]) -> list[list[float]]:
+        """Embed several queries, reusing the vectors of identical earlier queries.
+
+        Queries that are not cached are embedded with embed_query, or together
+        in a single embed_documents call if the model is symmetric.
+        """
+        unique = list(dict.fromkeys(texts))
+        found: dict[str, list[float]] = {}
+        with self._lock:
+            for text in unique:
+                vector = self._memory.get(text)
+                if vector is not None:
+                    found[text] = vector
+            missing = [text for text in unique if text not in found]
+            if missing:
+                found.update(self._persistent_lookup(missing))
+
+        missing = [text for text in unique if text not in found]
+        if self.symmetric and len(missing) > 1:
+            fresh = dict(zip(missing, self.embedding_model.embed_documents(missing)))
+        else:
+            fresh = {text: self.embedding_model.embed_query(text) for text in missing}
+        found.update(fresh)
+
+        with self._lock:
+            if fresh:
+                self._persistent_write(fresh)
+            for text in unique:
+                self._memory[text] = found[text]
+                self._memory.move_to_end(text)
+            while len(self._memory) > self.maxsize:
+                self._memory.popitem(last=False)
+        return [found[text] for text in texts]
+
+    def close(self) -> None:
+        """Close the persistent cache and the wrapped model, if it can be closed."""
+        if self.cache is not None:
+            self.cache.close()
+        close = getattr(self.embedding_model, "close", None)
+        if close is not None:
+            close()
+
+    def _persistent_lookup(self, texts: list[str]) -> dict[str, list[float]]:
+        """Return persisted vectors keyed by query; cache errors count as misses."""
+        if self.cache is None:
+            return {}
+        try:
+            cached = self.cache.lookup(texts)
+        except sqlite3.Error as e:
+            logging.getLogger().warning("Query embedding cache lookup failed: %s", e)
+            return {}
+
+        found = {}
+        for text in texts:
+            vector = cached.get(EmbeddingCache.hash_text(text))
+            if vector is not None:
+                found[text] = vector
+        return found
+
+    def _persistent_write(self, items: dict[str, list[float]]) -> None:
+        """Persist query vectors; cache errors are logged and ignored."""
+        if self.cache is None:
+            return
+        try:
+            self.cache.write(items)
+        except sqlite3.Error as e:
+            logging.getLogger().warning("Query embedding cache write failed: %s", e)
+
+
+def _encode_vector(vector: list[float]) -> bytes:
+    return array("f", vector).tobytes()
+
+
+def _decode_vector(blob: bytes) -> list[float]:
+    vector = array("f")
+    vector.frombytes(blob)
+    return vector.tolist()
@@ -2,6 +2,38 @@
 
 DEFAULT_HUGGINGFACE_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
 
+# Supported HuggingFace precisions mapped to the torch dtype names used to load the model
+HUGGINGFACE_PRECISION_DTYPES = {
+    "fp32": "float32",
+    "fp16": "float16",
+    "bf16": "bfloat16",
+}
+
+# Inference backends supported by SentenceTransformer
+HUGGINGFACE_BACKENDS = ("torch", "onnx", "openvino")
+
+DEFAULT_EMBEDDING_BATCH_SIZE = 64
+EMBEDDING_BATCH_PROBE_SIZES = (16, 64, 256)
+
+# Default number of embed_documents batches in flight for API-backed providers
+# (local models run one batch at a time)
+DEFAULT_REMOTE_EMBEDDING_CONCURRENCY = 8
+
+# Window for coalescing concurrent query embeddings into one batch
+DEFAULT_QUERY_BATCH_WAIT_MS = 5.0
+
+# Query vectors kept in memory by CachedEmbeddings
+QUERY_EMBEDDING_CACHE_SIZE = 4096
+# Suffix of the cache model key for query vectors, kept apart from document
+# vectors since some models embed queries differently
+QUERY_EMBEDDING_CACHE_MODEL_SUFFIX = ":query"
+
+# Hex digits of the embed_config digest included in embedding cache model keys
+EMBED_CONFIG_DIGEST_LENGTH = 16
+
+# Hashes per SELECT when looking up cached embeddings (below SQLite's variable limit)
+EMBEDDING_CACHE_LOOKUP_BATCH_SIZE = 500
+
 EMBEDDING_METADATA_KEY = "embedding"
 EMBEDDING_MODEL_METADATA_KEY = "embedding_model"
 
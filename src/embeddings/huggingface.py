@@ -5,7 +5,11 @@ from typing import Any
 
 from langchain_huggingface import HuggingFaceEmbeddings
 
-from .constants import DEFAULT_HUGGINGFACE_MODEL
+from .constants import (
+    DEFAULT_HUGGINGFACE_MODEL,
+    HUGGINGFACE_BACKENDS,
+    HUGGINGFACE_PRECISION_DTYPES,
+)
 from .protocol import Embeddings
 
 
@@ -19,6 +23,16 @@ def create_huggingface_embedding(config: dict[str, Any]) -> Embeddings:
         - model_name: str (optional) - Model name (defaults to DEFAULT_HUGGINGFACE_MODEL)
         - model_kwargs: dict (optional) - Additional model arguments
         - encode_kwargs: dict (optional) - Additional encoding arguments
+        - precision: str (optional) - Weight precision: "fp32" (default), "fp16"
+          or "bf16". Half precision roughly halves memory traffic and is
+          intended for GPUs (or CPUs with bf16 support).
+        - backend: str (optional) - Inference backend: "torch" (default), "onnx"
+          or "openvino". The ONNX backend exports the model on first use; an
+          ONNX Runtime execution provider (e.g. TensorrtExecutionProvider) can be
+          chosen with model_kwargs={"model_kwargs": {"provider": ...}}.
+        - max_seq_length: int (optional) - Truncate inputs to at most this many
+          tokens. Lowering the model's own limit bounds the tokenization and
+          attention cost of long chunks.
         - Other parameters supported by HuggingFaceEmbeddings constructor.
         Invalid parameters will be caught by HuggingFaceEmbeddings and raise clear errors.
 
@@ -35,8 +49,27 @@ def create_huggingface_embedding(config: dict[str, Any]) -> Embeddings:
     if "model_name" not in config:
         config = {**config, "model_name": DEFAULT_HUGGINGFACE_MODEL}
 
+    if "precision" in config and config.get("backend", "torch") != "torch":
+        raise ValueError("The 'precision' option only applies to the 'torch' backend")
+    if "precision" in config:
+        config = _apply_precision(config)
+    if "backend" in config:
+        config = _apply_backend(config)
+
+    max_seq_length = config.get("max_seq_length")
+    if max_seq_length is not None:
+        if (
+            not isinstance(max_seq_length, int)
+            or isinstance(max_seq_length, bool)
+            or max_seq_length <= 0
+        ):
+            raise ValueError(
+                f"max_seq_length must be a positive integer, got: {max_seq_length}"
+            )
+        config = {k: v for k, v in config.items() if k != "max_seq_length"}
+
     try:
-        return HuggingFaceEmbeddings(**config)
+        embeddings = HuggingFaceEmbeddings(**config)
     except TypeError as e:
         raise ValueError(
             f"Invalid parameter for HuggingFace embedding model: {e}. "
@@ -44,3 +77,72 @@ def create_huggingface_embedding(config: dict[str, Any]) -> Embeddings:
         ) from e
     except Exception as e:
         raise ValueError(f"Failed to create HuggingFace embedding model: {e}") from e
+
+    if max_seq_length is not None:
+        _apply_max_seq_length(embeddings, max_seq_length)
+    return embeddings
+
+
+def _apply_precision(config: dict[str, Any]) -> dict[str, Any]:
+    """Translate the 'precision' option into the dtype SentenceTransformer loads with.
+
+    Raises
+    ------
+    ValueError
+        If the precision is not supported.
+    """
+    config = dict(config)
+    precision = config.pop("precision")
+    if precision not in HUGGINGFACE_PRECISION_DTYPES:
+        raise ValueError(
+            f"Unsupported precision for HuggingFace embedding model: {precision}. "
+            f"Choose from: {', '.join(HUGGINGFACE_PRECISION_DTYPES)}"
+        )
+
+    model_kwargs = dict(config.get("model_kwargs") or {})
+    transformer_kwargs = dict(model_kwargs.get("model_kwargs") or {})
+    transformer_kwargs["torch_dtype"] = HUGGINGFACE_PRECISION_DTYPES[precision]
+    model_kwargs["model_kwargs"] = transformer_kwargs
+    config["model_kwargs"] = model_kwargs
+    return config
+
+
+def _apply_backend(config: dict[str, Any]) -> dict[str, Any]:
+    """Move the 'backend' option into the SentenceTransformer constructor arguments.
+
+    Raises
+    ------
+    ValueError
+        If the backend is not supported.
+    """
+    config = dict(config)
+    backend = config.pop("backend")
+    if backend not in HUGGINGFACE_BACKENDS:
+        raise ValueError(
+            f"Unsupported backend for HuggingFace embedding model: {backend}. "
+            f"Choose from: {', '.join(HUGGINGFACE_BACKENDS)}"
+        )
+
+    config["model_kwargs"] = {**(config.get("model_kwargs") or {}), "backend": backend}
+    return config
+
+
+def _apply_max_seq_length(embeddings: HuggingFaceEmbeddings, max_seq_length: int) -> None:
+    """Cap the token length of the SentenceTransformer behind ``embeddings``.
+
+    HuggingFaceEmbeddings has no option for this, so it is set on the
+    underlying client, never raising the model's own limit.
+
+    Raises
+    ------
+    ValueError
+        If the installed langchain_huggingface exposes no client with a
+        max_seq_length to set.
+    """
+    client = getattr(embeddings, "_client", None)
+    if client is None or not hasattr(client, "max_seq_length"):
+        raise ValueError(
+            "max_seq_length is not supported by this version of langchain_huggingface: "
+            "HuggingFaceEmbeddings has no SentenceTransformer client to configure"
+        )
+    client.max_seq_length = min(max_seq_length, client.max_seq_length or max_seq_length)
@@ -0,0 +1,33 @@
+"""Deferred attribute imports for package ``__init__`` modules."""
+from __future__ import annotations
+
+import importlib
+from typing import Any, Callable
+
+
+def lazy_getattr(package: str, attributes: dict[str, str]) -> Callable[[str], Any]:
+    """Build a module ``__getattr__`` that imports attributes on first access.
+
+    Lets packages re-export their factories and implementations without
+    importing LangChain, model libraries or vector stores until they are
+    actually used, so commands that only need the configuration start fast.
+
+    Parameters
+    ----------
+    package
+        Name of the package (``__name__`` of the ``__init__`` module).
+    attributes
+        Mapping of exported attribute name to the relative module defining it.
+
+    Returns
+    -------
+    Function to assign to the package's module-level ``__getattr__``.
+    """
+
+    def __getattr__(name: str) -> Any:
+        if name not in attributes:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        module = importlib.import_module(attributes[name], package)
+        return getattr(module, name)
+
+    return __getattr__
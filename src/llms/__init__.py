@@ -1,7 +1,12 @@
 """LLM implementations."""
 
-from .factory import LLMFactory
+from ..lazy_imports import lazy_getattr
 from .protocol import LLM
 from .types import LLMType
 
+# Imported on first access; they pull in LangChain and model libraries.
+__getattr__ = lazy_getattr(__name__, {
+    "LLMFactory": ".factory",
+})
+
 __all__ = ["LLMFactory", "LLMType", "LLM"]
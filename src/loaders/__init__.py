@@ -1,9 +1,14 @@
 """Document loader implementations."""
 
-from .factory import LoaderFactory
-from .helpers import LoaderHelper
-from .protocol import DocumentLoader
-from .pymupdf_loader import PyMuPDFLoader
+from ..lazy_imports import lazy_getattr
 from .types import LoaderType
 
+# Imported on first access; they pull in LangChain and model libraries.
+__getattr__ = lazy_getattr(__name__, {
+    "DocumentLoader": ".protocol",
+    "LoaderFactory": ".factory",
+    "LoaderHelper": ".helpers",
+    "PyMuPDFLoader": ".pymupdf_loader",
+})
+
 __all__ = ["DocumentLoader", "LoaderFactory", "LoaderHelper", "LoaderType", "PyMuPDFLoader"]
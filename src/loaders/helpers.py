@@ -1,6 +1,8 @@
 """Helper class for working with loaders."""
 from __future__ import annotations
 
+import os
+import stat
 from pathlib import Path
 from typing import Any
 
@@ -109,10 +111,12 @@ class LoaderHelper:
         if not isinstance(input_path, Path):
             raise TypeError(f"input_path must be a Path object, got {type(input_path)}")
 
-        if not input_path.exists():
-            raise FileNotFoundError(f"Path not found: {input_path}")
+        try:
+            mode = input_path.stat().st_mode
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"Path not found: {input_path}") from e
 
-        if input_path.is_file():
+        if stat.S_ISREG(mode):
             suffix = input_path.suffix.lower()
             if suffix not in SUPPORTED_FILE_EXTENSIONS:
                 supported = ", ".join(SUPPORTED_FILE_EXTENSIONS)
@@ -122,16 +126,24 @@ class LoaderHelper:
                 )
             return [input_path]
 
-        if not input_path.is_dir():
+        if not stat.S_ISDIR(mode):
             raise ValueError(f"Path is neither a file nor a directory: {input_path}")
 
-        media_files = [
-            path for ext in SUPPORTED_FILE_EXTENSIONS
-            for path in input_path.glob(f"*{ext}")
-            if path.is_file()
-        ]
-
-        media_files = sorted(media_files)
+        # A single scandir pass: DirEntry caches the file type, so no extra
+        # stat call is needed per entry.
+        extensions = tuple(SUPPORTED_FILE_EXTENSIONS)
+        with os.scandir(input_path) as entries:
+            names = [
+                entry.name
+                for entry in entries
+                if entry.name.lower().endswith(extensions) and entry.is_file()
+            ]
+
+        # All entries share a parent, so sorting the names (normcased, as Path
+        # comparison does) gives the same order as sorting the Paths, without
+        # the cost of Path comparisons.
+        names.sort(key=os.path.normcase)
+        media_files = [input_path / name for name in names]
         if not media_files:
             supported = ", ".join(SUPPORTED_FILE_EXTENSIONS)
             raise FileNotFoundError(
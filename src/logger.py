@@ -8,10 +8,10 @@ class Logger:
     """Static logger utility class for configuring and accessing loggers."""
 
     @staticmethod
-    def setup(config) -> None:
+    def setup(config, stream=None) -> None:
         logging.basicConfig(
             level=config.logging.get_level(),
             format="%(message)s",
-            stream=sys.stdout,
+            stream=stream or sys.stdout,
             force=True,  # Override any existing configuration
         )
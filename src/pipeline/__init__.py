@@ -1,12 +1,18 @@
 """Pipeline infrastructure for executing sequential processing steps."""
 from __future__ import annotations
 
+from ..lazy_imports import lazy_getattr
 from .context import PipelineContext
-from .contexts import IngestionContext, QueryContext
 from .executor import PipelineExecutor
 from .status import PipelineStatus
 from .step import PipelineStep
 
+# The concrete contexts hold LangChain Documents; import them on first access.
+__getattr__ = lazy_getattr(__name__, {
+    "IngestionContext": ".contexts",
+    "QueryContext": ".contexts",
+})
+
 __all__ = [
     "PipelineStep",
     "PipelineExecutor",
@@ -36,7 +36,7 @@ class ChunkStep:
 
         logger.info(f"Chunking markdown file: {context.markdown_path}")
 
-        chunks = self.chunker.chunk_markdown_file(str(context.markdown_path))
+        chunks = self.chunker.chunk_markdown_file(context.markdown_path)
         context.chunks = chunks
 
         logger.info(f"Created {len(chunks)} chunks")
@@ -2,9 +2,11 @@
 from __future__ import annotations
 
 import logging
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
 
-from langchain.schema import Document
-
+from ...embeddings.cache import EmbeddingCache
 from ...embeddings.constants import EMBEDDING_METADATA_KEY, EMBEDDING_MODEL_METADATA_KEY
 from ...embeddings.protocol import Embeddings
 from ...embeddings.types import EmbeddingModelType
@@ -15,7 +17,14 @@ from ..step import PipelineStep
 class EmbeddingGenerationStep:
     """Step that generates embeddings for document chunks."""
 
-    def __init__(self, embedding_model: Embeddings, model_name: EmbeddingModelType):
+    def __init__(
+        self,
+        embedding_model: Embeddings,
+        model_name: EmbeddingModelType,
+        batch_size: Optional[int] = None,
+        cache: Optional[EmbeddingCache] = None,
+        max_concurrency: int = 1,
+    ):
         """Initialize the embedding generation step.
 
         Parameters
@@ -24,9 +33,21 @@ class EmbeddingGenerationStep:
             Embedding model instance created by EmbeddingModelFactory.
         model_name
             Name of the embedding model (for metadata tracking).
+        batch_size
+            Maximum number of chunks per embed_documents call.
+            If None, all chunks are embedded in a single call.
+        cache
+            Optional embedding cache. Chunks whose text is already cached for
+            the same provider and model are not sent to the embedding model.
+        max_concurrency
+            Maximum number of embed_documents calls in flight at once. Values
+            above 1 overlap request latency for API-backed models.
         """
         self.embedding_model = embedding_model
         self.model_name = model_name
+        self.batch_size = batch_size
+        self.cache = cache
+        self.max_concurrency = max_concurrency
 
     def run(self, context: IngestionContext) -> None:
         """Generate embeddings for all chunks.
@@ -41,24 +62,81 @@ class EmbeddingGenerationStep:
             context.mark_failed("No chunks available. Chunk step must run first.")
             return
 
-        logger.info(f"Generating embeddings for {len(context.chunks)} chunks")
+        logger.info("Generating embeddings for %d chunks", len(context.chunks))
 
         texts = [chunk.page_content for chunk in context.chunks]
-        embeddings = self.embedding_model.embed_documents(texts)
+        if self.cache is not None:
+            embeddings = self._embed_texts_cached(texts)
+        else:
+            embeddings = self._embed_texts(texts)
 
-        embedded_chunks = []
+        # Attach embeddings to the existing chunks rather than copying them,
+        # so only one Document per chunk is alive at a time.
+        model_name = self.model_name.value
         for chunk, embedding in zip(context.chunks, embeddings):
-            embedded_chunk = Document(
-                page_content=chunk.page_content,
-                metadata={
-                    **chunk.metadata,
-                    EMBEDDING_METADATA_KEY: embedding,
-                    EMBEDDING_MODEL_METADATA_KEY: self.model_name.value,
-                }
-            )
-            embedded_chunks.append(embedded_chunk)
+            chunk.metadata.update({
+                EMBEDDING_METADATA_KEY: embedding,
+                EMBEDDING_MODEL_METADATA_KEY: model_name,
+            })
 
         context.vectors = embeddings
-        context.chunks = embedded_chunks
 
-        logger.info(f"Generated embeddings for {len(embedded_chunks)} chunks")
+        logger.info("Generated embeddings for %d chunks", len(context.chunks))
+
+    def _embed_texts_cached(self, texts: list[str]) -> list[list[float]]:
+        """Embed only the texts missing from the cache and store the new vectors.
+
+        Cache errors are logged and fall back to embedding every text.
+        """
+        logger = logging.getLogger()
+        hashes = [EmbeddingCache.hash_text(text) for text in texts]
+        try:
+            cached = self.cache.lookup(texts)
+        except sqlite3.Error as e:
+            logger.warning("Embedding cache lookup failed, embedding all chunks: %s", e)
+            return self._embed_texts(texts)
+
+        # First position of each distinct text that is not cached yet
+        missing: dict[str, int] = {}
+        for i, text_hash in enumerate(hashes):
+            if text_hash not in cached and text_hash not in missing:
+                missing[text_hash] = i
+        logger.info(
+            "Embedding cache: %d hits, %d to embed", len(texts) - len(missing), len(missing)
+        )
+
+        missing_texts = [texts[i] for i in missing.values()]
+        vectors = self._embed_texts(missing_texts) if missing else []
+        fresh = dict(zip(missing.keys(), vectors))
+        if fresh:
+            try:
+                self.cache.write(dict(zip(missing_texts, vectors)))
+            except sqlite3.Error as e:
+                logger.warning("Embedding cache write failed: %s", e)
+
+        return [cached[h] if h in cached else fresh[h] for h in hashes]
+
+    def _embed_texts(self, texts: list[str]) -> list[list[float]]:
+        """Embed texts in length-sorted batches and return vectors in input order.
+
+        Batching texts of similar length keeps padding low for transformer
+        models, which pad every batch to its longest sequence. With
+        max_concurrency above 1, batches are sent from a thread pool.
+        """
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        batch_size = self.batch_size or len(texts)
+        batches = [order[start:start + batch_size] for start in range(0, len(order), batch_size)]
+        batch_texts = [[texts[i] for i in batch] for batch in batches]
+
+        workers = min(self.max_concurrency, len(batches))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                batch_vectors = list(pool.map(self.embedding_model.embed_documents, batch_texts))
+        else:
+            batch_vectors = [self.embedding_model.embed_documents(batch) for batch in batch_texts]
+
+        embeddings: list[list[float]] = [[] for _ in texts]
+        for batch, vectors in zip(batches, batch_vectors):
+            for i, vector in zip(batch, vectors):
+                embeddings[i] = vector
+        return embeddings
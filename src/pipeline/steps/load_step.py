@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import logging
 
+from ...constants import DEFAULT_ENCODING
 from ...loaders.protocol import DocumentLoader
 from ..contexts.ingestion_context import IngestionContext
 from ..step import PipelineStep
@@ -34,6 +35,8 @@ class LoadStep:
 
         markdown_path = self.loader.to_markdown_file()
         context.markdown_path = markdown_path
-        context.raw_text = self.loader.to_markdown_text()
+        # Read back the file just written instead of rendering the document a
+        # second time with to_markdown_text().
+        context.raw_text = markdown_path.read_text(encoding=DEFAULT_ENCODING)
 
         logger.info(f"Markdown saved to: {markdown_path}")
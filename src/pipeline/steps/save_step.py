@@ -3,6 +3,9 @@ from __future__ import annotations
 
 import logging
 
+from langchain.schema import Document
+
+from ...chunkers.constants import CHUNK_INDEX_METADATA_KEY, SOURCE_METADATA_KEY
 from ...embeddings.constants import EMBEDDING_METADATA_KEY
 from ...vector_stores.constants import CHUNK_ID_PREFIX
 from ...vector_stores.protocol import VectorStore
@@ -13,15 +16,19 @@ from ..step import PipelineStep
 class SaveStep:
     """Step that saves chunks with embeddings to the vector store."""
 
-    def __init__(self, vector_store: VectorStore):
+    def __init__(self, vector_store: VectorStore, persist: bool = True):
         """Initialize the save step.
 
         Parameters
         ----------
         vector_store
             Vector store instance created by VectorStoreFactory.
+        persist
+            Whether to persist the vector store after saving. Callers that
+            save several contexts can disable it and persist once at the end.
         """
         self.vector_store = vector_store
+        self.persist = persist
 
     def run(self, context: IngestionContext) -> None:
         """Save chunks with embeddings to the vector store.
@@ -38,6 +45,16 @@ class SaveStep:
 
         logger.info(f"Saving {len(context.chunks)} chunks to vector store")
 
+        # Drop the chunks saved by an earlier ingestion of the same files, so
+        # a file that now yields fewer chunks leaves no stale ones behind
+        sources = list(dict.fromkeys(
+            chunk.metadata[SOURCE_METADATA_KEY]
+            for chunk in context.chunks
+            if SOURCE_METADATA_KEY in chunk.metadata
+        ))
+        if sources:
+            self.vector_store.delete_sources(sources)
+
         has_embeddings = any(
             EMBEDDING_METADATA_KEY in chunk.metadata for chunk in context.chunks
         )
@@ -51,7 +68,7 @@ class SaveStep:
                 {k: v for k, v in chunk.metadata.items() if k != EMBEDDING_METADATA_KEY}
                 for chunk in context.chunks
             ]
-            ids = [f"{CHUNK_ID_PREFIX}{i}" for i in range(len(context.chunks))]
+            ids = [_chunk_id(chunk, i) for i, chunk in enumerate(context.chunks)]
 
             self.vector_store.add_texts(
                 texts=texts,
@@ -62,5 +79,19 @@ class SaveStep:
         else:
             self.vector_store.add_documents(context.chunks)
 
-        self.vector_store.persist()
+        if self.persist:
+            self.vector_store.persist()
         logger.info(f"Saved {len(context.chunks)} chunks to vector store")
+
+
+def _chunk_id(chunk: Document, position: int) -> str:
+    """Return a vector store ID that is unique across source files.
+
+    IDs are derived from the chunk's source and index, so one file's chunks
+    never overwrite another file's.
+    """
+    source = chunk.metadata.get(SOURCE_METADATA_KEY)
+    index = chunk.metadata.get(CHUNK_INDEX_METADATA_KEY, position)
+    if source is None:
+        return f"{CHUNK_ID_PREFIX}{position}"
+    return f"{CHUNK_ID_PREFIX}{source}:{index}"
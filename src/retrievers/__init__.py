@@ -1,9 +1,20 @@
 """Retriever implementations."""
 
-from .factory import RetrieverFactory
-from .protocol import Retriever
-from .similarity_retriever import DocumentRetriever
+from ..lazy_imports import lazy_getattr
 from .types import RetrieverType
 
-__all__ = ["DocumentRetriever", "Retriever", "RetrieverFactory", "RetrieverType"]
+# Imported on first access; they pull in LangChain and model libraries.
+__getattr__ = lazy_getattr(__name__, {
+    "DocumentRetriever": ".similarity_retriever",
+    "LockedRetriever": ".locked_retriever",
+    "Retriever": ".protocol",
+    "RetrieverFactory": ".factory",
+})
 
+__all__ = [
+    "DocumentRetriever",
+    "LockedRetriever",
+    "Retriever",
+    "RetrieverFactory",
+    "RetrieverType",
+]
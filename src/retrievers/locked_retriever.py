@@ -0,0 +1,42 @@
+"""Retriever wrapper that serializes access to a shared vector store."""
+from __future__ import annotations
+
+import threading
+from typing import Optional
+
+from langchain.schema import Document
+
+from .protocol import Retriever
+
+
+class LockedRetriever:
+    """Retriever wrapper that runs one retrieval at a time.
+
+    Long-running servers answer queries from several threads with the same
+    components. The Chroma client and its HNSW index are not documented as
+    safe for concurrent use, so every retrieval holds ``lock``; other code
+    searching the same vector store directly should hold it too.
+    """
+
+    def __init__(self, retriever: Retriever, lock: Optional[threading.Lock] = None):
+        """Wrap a retriever.
+
+        Parameters
+        ----------
+        retriever
+            Retriever instance created by RetrieverFactory.
+        lock
+            Lock to hold around each retrieval (a new one if None).
+        """
+        self.retriever = retriever
+        self.lock = lock or threading.Lock()
+
+    def retrieve(self, query: str) -> list[Document]:
+        """Retrieve relevant documents for a query."""
+        with self.lock:
+            return self.retriever.retrieve(query)
+
+    def retrieve_with_scores(self, query: str) -> list[tuple[Document, float]]:
+        """Retrieve documents with similarity scores."""
+        with self.lock:
+            return self.retriever.retrieve_with_scores(query)
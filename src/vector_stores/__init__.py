@@ -1,8 +1,12 @@
 """Vector store implementations."""
 
-from .factory import VectorStoreFactory
-from .protocol import VectorStore
+from ..lazy_imports import lazy_getattr
 from .types import VectorStoreType
 
-__all__ = ["VectorStore", "VectorStoreFactory", "VectorStoreType"]
+# Imported on first access; they pull in LangChain and model libraries.
+__getattr__ = lazy_getattr(__name__, {
+    "VectorStore": ".protocol",
+    "VectorStoreFactory": ".factory",
+})
 
+__all__ = ["VectorStore", "VectorStoreFactory", "VectorStoreType"]
@@ -1,15 +1,63 @@
 """ChromaDB vector store implementation."""
 from __future__ import annotations
 
-from typing import Any
+import uuid
+from collections.abc import Iterable
+from typing import Any, Optional
 
 from langchain_community.vectorstores import Chroma
 
+from ..chunkers.constants import SOURCE_METADATA_KEY
 from ..embeddings.protocol import Embeddings
-from .constants import DEFAULT_COLLECTION_NAME, DEFAULT_VECTOR_DB_DIR
+from .constants import (
+    CHROMA_DISTANCES,
+    CHROMA_UPSERT_BATCH_SIZE,
+    DEFAULT_COLLECTION_NAME,
+    DEFAULT_VECTOR_DB_DIR,
+)
 from .protocol import VectorStore
 
 
+class ChromaVectorStore(Chroma):
+    """LangChain Chroma store that honors pre-computed embeddings.
+
+    LangChain's Chroma.add_texts ignores an ``embeddings`` argument and embeds
+    every text again with the embedding function. This subclass writes the
+    given embeddings directly, in upserts of CHROMA_UPSERT_BATCH_SIZE rows.
+    """
+
+    def add_texts(
+        self,
+        texts: Iterable[str],
+        metadatas: Optional[list[dict]] = None,
+        ids: Optional[list[str]] = None,
+        embeddings: Optional[list[list[float]]] = None,
+        **kwargs: Any,
+    ) -> list[str]:
+        """Add texts, using ``embeddings`` instead of re-embedding when given."""
+        if embeddings is None:
+            return super().add_texts(texts, metadatas=metadatas, ids=ids, **kwargs)
+
+        texts = list(texts)
+        if ids is None:
+            ids = [str(uuid.uuid4()) for _ in texts]
+
+        for start in range(0, len(texts), CHROMA_UPSERT_BATCH_SIZE):
+            end = start + CHROMA_UPSERT_BATCH_SIZE
+            self._collection.upsert(
+                ids=ids[start:end],
+                embeddings=embeddings[start:end],
+                documents=texts[start:end],
+                metadatas=metadatas[start:end] if metadatas else None,
+            )
+        return ids
+
+    def delete_sources(self, sources: list[str]) -> None:
+        """Delete every document whose source metadata is one of ``sources``."""
+        if sources:
+            self._collection.delete(where={SOURCE_METADATA_KEY: {"$in": list(sources)}})
+
+
 def create_chromadb_store(config: dict[str, Any]) -> VectorStore:
     """Create a ChromaDB vector store from configuration.
 
@@ -20,6 +68,11 @@ def create_chromadb_store(config: dict[str, Any]) -> VectorStore:
         - embedding_function: Embeddings (required) - Embedding model instance
         - persist_directory: str (optional) - Directory to persist the database
         - collection_name: str (optional) - Name of the collection
+        - distance: str (optional) - HNSW distance function of a new collection:
+          "l2" (ChromaDB default), "ip" or "cosine". With embeddings that are
+          already unit-normalized, "ip" ranks like cosine while skipping the
+          per-comparison normalization. Only applies when the collection is
+          created; existing collections keep their distance function.
 
     Returns
     -------
@@ -28,7 +81,7 @@ def create_chromadb_store(config: dict[str, Any]) -> VectorStore:
     Raises
     ------
     ValueError
-        If embedding_function is not provided.
+        If embedding_function is not provided or distance is not supported.
     """
     persist_directory = config.get("persist_directory", DEFAULT_VECTOR_DB_DIR)
     collection_name = config.get("collection_name", DEFAULT_COLLECTION_NAME)
@@ -40,9 +93,20 @@ def create_chromadb_store(config: dict[str, Any]) -> VectorStore:
             "Pass it via config: {'embedding_function': embedder.embedding_model}"
         )
 
-    return Chroma(
+    collection_metadata = None
+    distance = config.get("distance")
+    if distance is not None:
+        if distance not in CHROMA_DISTANCES:
+            raise ValueError(
+                f"Unsupported ChromaDB distance: {distance}. "
+                f"Choose from: {', '.join(CHROMA_DISTANCES)}"
+            )
+        collection_metadata = {"hnsw:space": distance}
+
+    return ChromaVectorStore(
         embedding_function=embedding_function,
         persist_directory=persist_directory,
         collection_name=collection_name,
+        collection_metadata=collection_metadata,
     )
 
@@ -6,3 +6,13 @@ DEFAULT_VECTOR_DB_DIR = "./vector_db"
 
 CHUNK_ID_PREFIX = "chunk_"
 
+# HNSW distance functions supported by ChromaDB (collection "hnsw:space")
+CHROMA_DISTANCES = ("l2", "ip", "cosine")
+
+
+# Rows per upsert call when adding pre-computed embeddings to ChromaDB
+CHROMA_UPSERT_BATCH_SIZE = 1000
+
+# File (inside persist_directory) recording which input files were ingested
+INGESTED_FILES_DB_NAME = "ingested_files.sqlite"
+FILE_HASH_READ_SIZE = 1024 * 1024
@@ -0,0 +1,101 @@
+"""Record of the input files already stored in a vector store collection."""
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+from pathlib import Path
+from typing import Union
+
+from .constants import FILE_HASH_READ_SIZE
+
+
+class IngestedFiles:
+    """SQLite-backed fingerprints of ingested input files.
+
+    Each row stores the content hash, modification time and size of an input
+    file for a collection, together with the settings it was ingested with.
+    A file is unchanged if it was ingested with the current settings and its
+    size and modification time match the recorded ones, or, failing that,
+    its content hash does.
+    """
+
+    def __init__(self, path: Union[str, Path], collection_name: str, settings: str = ""):
+        """Open (or create) the database.
+
+        Parameters
+        ----------
+        path
+            Path to the SQLite database file.
+        collection_name
+            Vector store collection the files were ingested into.
+        settings
+            Identifier of the settings that shape the stored chunks (chunking
+            parameters and embedding model). Files recorded with other
+            settings count as changed.
+        """
+        self.path = Path(path).expanduser()
+        self.collection_name = collection_name
+        self.settings = settings
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path))
+        columns = {
+            row[1] for row in self._conn.execute("PRAGMA table_info(ingested_files)")
+        }
+        if columns and "settings" not in columns:
+            # Rows from before settings were recorded cannot be trusted;
+            # dropping them only means those files are ingested once more
+            self._conn.execute("DROP TABLE ingested_files")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS ingested_files ("
+            "collection TEXT, path TEXT, hash TEXT, mtime_ns INTEGER, size INTEGER, "
+            "settings TEXT, PRIMARY KEY (collection, path))"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def hash_file(file_path: Path) -> str:
+        """Return the BLAKE2b digest of a file's content."""
+        digest = hashlib.blake2b()
+        with file_path.open("rb") as f:
+            while block := f.read(FILE_HASH_READ_SIZE):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def is_unchanged(self, file_path: Path) -> bool:
+        """Return True if the file was ingested before and has not changed since."""
+        row = self._conn.execute(
+            "SELECT hash, mtime_ns, size FROM ingested_files "
+            "WHERE collection = ? AND path = ? AND settings = ?",
+            (self.collection_name, str(file_path.resolve()), self.settings),
+        ).fetchone()
+        if row is None:
+            return False
+
+        stored_hash, mtime_ns, size = row
+        stat = file_path.stat()
+        if stat.st_mtime_ns == mtime_ns and stat.st_size == size:
+            return True
+        # Touched but possibly identical (e.g. copied or re-downloaded)
+        return self.hash_file(file_path) == stored_hash
+
+    def record(self, file_path: Path) -> None:
+        """Insert or replace the fingerprint of a file ingested with the current settings."""
+        stat = file_path.stat()
+        self._conn.execute(
+            "INSERT OR REPLACE INTO ingested_files "
+            "(collection, path, hash, mtime_ns, size, settings) VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                self.collection_name,
+                str(file_path.resolve()),
+                self.hash_file(file_path),
+                stat.st_mtime_ns,
+                stat.st_size,
+                self.settings,
+            ),
+        )
+        self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
@@ -74,6 +74,16 @@ class VectorStore(Protocol):
         """Persist the vector store to disk."""
         ...
 
+    def delete_sources(self, sources: list[str]) -> None:
+        """Delete every document whose source metadata is one of ``sources``.
+
+        Parameters
+        ----------
+        sources
+            Source paths (the chunks' "source" metadata) to delete.
+        """
+        ...
+
     def delete(self, ids: Optional[list[str]] = None) -> None:
         """Delete documents or the entire collection.
 
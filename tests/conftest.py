@@ -0,0 +1,48 @@
+"""Shared test setup.
+
+The model integrations (HuggingFace, OpenAI, Gemini, PyMuPDF) are heavy and
+not needed by the unit tests, but the factories import them at module level.
+Any that are not installed get a stand-in module whose classes raise when
+instantiated, so the modules importing them can be tested without them.
+"""
+import importlib
+import sys
+import types
+
+
+def _unavailable(module_name: str, attribute: str):
+    """Return a stand-in class that fails loudly if a test ever creates it."""
+
+    def __init__(_self, *_args, **_kwargs):
+        raise ImportError(f"{module_name} is not installed ({attribute} is a test stand-in)")
+
+    return type(attribute, (), {"__init__": __init__})
+
+
+def _install_stand_in(module_name: str, classes: tuple[str, ...] = (), functions: tuple[str, ...] = ()):
+    """Register a stand-in for ``module_name`` unless the real module imports."""
+    try:
+        importlib.import_module(module_name)
+    except ImportError:
+        pass
+    else:
+        return
+
+    parent_name, _, child_name = module_name.rpartition(".")
+    if parent_name and parent_name not in sys.modules:
+        _install_stand_in(parent_name)
+
+    module = types.ModuleType(module_name)
+    for name in classes:
+        setattr(module, name, _unavailable(module_name, name))
+    for name in functions:
+        setattr(module, name, _unavailable(module_name, name))
+    sys.modules[module_name] = module
+    if parent_name:
+        setattr(sys.modules[parent_name], child_name, module)
+
+
+_install_stand_in("langchain_huggingface", classes=("HuggingFaceEmbeddings",))
+_install_stand_in("langchain_openai", classes=("OpenAIEmbeddings",))
+_install_stand_in("google.genai", classes=("Client",))
+_install_stand_in("pymupdf4llm", functions=("to_markdown",))
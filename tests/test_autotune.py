@@ -0,0 +1,68 @@
+"""Tests for embedding batch size probing."""
+import time
+import tracemalloc
+
+from src.embeddings.autotune import find_optimal_embed_batch
+from src.embeddings.constants import DEFAULT_EMBEDDING_BATCH_SIZE
+
+
+class OverheadEmbeddings:
+    """Embedding model whose calls cost a fixed latency plus memory per text."""
+
+    def __init__(self, bytes_per_text=0):
+        self.bytes_per_text = bytes_per_text
+        self.sizes = []
+
+    def embed_documents(self, texts):
+        self.sizes.append(len(texts))
+        buffer = bytearray(self.bytes_per_text * len(texts))
+        time.sleep(0.02)
+        del buffer
+        return [[0.0] for _ in texts]
+
+
+def test_picks_the_fastest_candidate():
+    model = OverheadEmbeddings()
+
+    size = find_optimal_embed_batch(model, ["text"] * 8, candidates=(2, 4, 8))
+
+    assert size == 8
+    assert model.sizes == [2, 4, 8]
+
+
+def test_stops_at_candidates_larger_than_the_sample():
+    model = OverheadEmbeddings()
+
+    assert find_optimal_embed_batch(model, ["text"] * 5, candidates=(2, 4, 8)) == 4
+    assert model.sizes == [2, 4]
+
+
+def test_falls_back_to_the_default_without_enough_samples():
+    model = OverheadEmbeddings()
+
+    assert find_optimal_embed_batch(model, ["text"], candidates=(2, 4)) == DEFAULT_EMBEDDING_BATCH_SIZE
+    assert model.sizes == []
+
+
+def test_stops_when_a_call_exceeds_the_memory_budget():
+    # Half of the budget (500 kB) fits batches of 2 and 4 but not 8
+    model = OverheadEmbeddings(bytes_per_text=100_000)
+
+    size = find_optimal_embed_batch(
+        model, ["text"] * 8, max_bytes=1_000_000, candidates=(2, 4, 8)
+    )
+
+    assert size == 4
+    assert model.sizes == [2, 4, 8]
+    assert not tracemalloc.is_tracing()
+
+
+def test_budget_is_measured_per_call():
+    # Memory released by earlier calls must not count against later ones
+    model = OverheadEmbeddings(bytes_per_text=100_000)
+
+    size = find_optimal_embed_batch(
+        model, ["text"] * 8, max_bytes=2_000_000, candidates=(2, 4, 8)
+    )
+
+    assert size == 8
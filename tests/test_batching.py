@@ -0,0 +1,84 @@
+"""Tests for query micro-batching."""
+import threading
+
+import pytest
+from pydantic import ValidationError
+
+from src.config.embedding import EmbeddingConfig
+from src.embeddings.batching import BatchingEmbeddings
+
+
+class FakeEmbeddings:
+    """Embedding model recording the size of each embed_documents call."""
+
+    def __init__(self, error=None):
+        self.batches = []
+        self.error = error
+
+    def embed_documents(self, texts):
+        self.batches.append(list(texts))
+        if self.error is not None:
+            raise self.error
+        return [[float(len(text))] for text in texts]
+
+
+def embed_concurrently(embeddings, texts):
+    results = {}
+
+    def worker(text):
+        results[text] = embeddings.embed_query(text)
+
+    threads = [threading.Thread(target=worker, args=(text,)) for text in texts]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_concurrent_queries_share_batches():
+    model = FakeEmbeddings()
+    embeddings = BatchingEmbeddings(model, max_batch_size=4, max_wait=0.2)
+    try:
+        results = embed_concurrently(embeddings, ["a", "bb", "ccc", "dddd", "eeeee", "ffffff"])
+    finally:
+        embeddings.close()
+
+    assert results == {text: [float(len(text))] for text in results}
+    assert sorted(text for batch in model.batches for text in batch) == sorted(results)
+    assert all(len(batch) <= 4 for batch in model.batches)
+    assert len(model.batches) < len(results)
+
+
+def test_model_errors_reach_every_query_of_the_batch():
+    embeddings = BatchingEmbeddings(
+        FakeEmbeddings(error=RuntimeError("model down")), max_batch_size=8, max_wait=0
+    )
+    try:
+        with pytest.raises(RuntimeError, match="model down"):
+            embeddings.embed_query("a")
+        # The worker survives the failure
+        with pytest.raises(RuntimeError, match="model down"):
+            embeddings.embed_query("b")
+    finally:
+        embeddings.close()
+
+
+def test_close_stops_the_worker():
+    embeddings = BatchingEmbeddings(FakeEmbeddings(), max_batch_size=8, max_wait=0)
+    assert embeddings.embed_query("a") == [1.0]
+
+    embeddings.close()
+    embeddings.close()
+
+    assert not embeddings._worker.is_alive()
+    with pytest.raises(RuntimeError, match="closed"):
+        embeddings.embed_query("a")
+
+
+def test_query_batching_requires_a_symmetric_model():
+    with pytest.raises(ValidationError, match="symmetric_queries"):
+        EmbeddingConfig(query_max_batch_size=8)
+
+    config = EmbeddingConfig(query_max_batch_size=8, symmetric_queries=True)
+    assert config.query_max_batch_size == 8
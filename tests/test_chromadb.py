@@ -0,0 +1,155 @@
+"""Tests for the ChromaDB vector store and the chunks SaveStep writes to it."""
+import pytest
+from langchain.schema import Document
+
+from src.chunkers.constants import CHUNK_INDEX_METADATA_KEY, SOURCE_METADATA_KEY
+from src.embeddings.constants import EMBEDDING_METADATA_KEY
+from src.pipeline.contexts.ingestion_context import IngestionContext
+from src.pipeline.steps.save_step import SaveStep
+from src.vector_stores.chromadb import ChromaVectorStore
+
+
+class FakeCollection:
+    """In-memory stand-in for a chromadb Collection (upsert, delete, get)."""
+
+    def __init__(self):
+        self.rows = {}
+        self.upserts = []
+
+    def upsert(self, ids, embeddings=None, documents=None, metadatas=None):
+        self.upserts.append(list(ids))
+        for i, row_id in enumerate(ids):
+            self.rows[row_id] = {
+                "embedding": embeddings[i] if embeddings is not None else None,
+                "document": documents[i],
+                "metadata": metadatas[i] if metadatas else None,
+            }
+
+    def delete(self, ids=None, where=None):
+        if ids is not None:
+            for row_id in ids:
+                self.rows.pop(row_id, None)
+        if where is not None:
+            ((key, condition),) = where.items()
+            self.rows = {
+                row_id: row
+                for row_id, row in self.rows.items()
+                if (row["metadata"] or {}).get(key) not in condition["$in"]
+            }
+
+
+class FakeEmbeddings:
+    """Embedding model whose vectors encode the text length."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def embed_documents(self, texts):
+        self.calls += 1
+        return [[float(len(text)), 0.0] for text in texts]
+
+
+@pytest.fixture
+def store():
+    # Skip Chroma.__init__, which opens a chromadb client
+    store = ChromaVectorStore.__new__(ChromaVectorStore)
+    store._collection = FakeCollection()
+    store._embedding_function = FakeEmbeddings()
+    return store
+
+
+def embedded_chunks(source, count):
+    return [
+        Document(
+            page_content=f"{source} chunk {i}",
+            metadata={
+                SOURCE_METADATA_KEY: source,
+                CHUNK_INDEX_METADATA_KEY: i,
+                EMBEDDING_METADATA_KEY: [float(i), 1.0],
+            },
+        )
+        for i in range(count)
+    ]
+
+
+def save(store, source, count):
+    context = IngestionContext(file_path="doc.pdf", chunks=embedded_chunks(source, count))
+    SaveStep(store, persist=False).run(context)
+    assert context.error is None
+
+
+def test_reingesting_a_shrunk_file_leaves_no_stale_chunks(store):
+    save(store, "md/a.md", 40)
+    save(store, "md/b.md", 3)
+
+    save(store, "md/a.md", 25)
+
+    ids = set(store._collection.rows)
+    assert {f"chunk_md/a.md:{i}" for i in range(25)} <= ids
+    assert not {f"chunk_md/a.md:{i}" for i in range(25, 40)} & ids
+    assert {f"chunk_md/b.md:{i}" for i in range(3)} <= ids
+    assert len(ids) == 28
+
+
+def test_add_texts_stores_the_supplied_embeddings(store):
+    ids = store.add_texts(
+        ["alpha", "beta"],
+        metadatas=[{SOURCE_METADATA_KEY: "a.md"}, {SOURCE_METADATA_KEY: "a.md"}],
+        ids=["a", "b"],
+        embeddings=[[9.0, 9.0], [8.0, 8.0]],
+    )
+
+    assert ids == ["a", "b"]
+    assert store._embedding_function.calls == 0
+    assert store._collection.rows["a"]["embedding"] == [9.0, 9.0]
+    assert store._collection.rows["b"] == {
+        "embedding": [8.0, 8.0],
+        "document": "beta",
+        "metadata": {SOURCE_METADATA_KEY: "a.md"},
+    }
+
+
+def test_add_texts_replaces_rows_with_the_same_id(store):
+    store.add_texts(["old"], ids=["a"], embeddings=[[1.0]])
+
+    store.add_texts(["new"], ids=["a"], embeddings=[[2.0]])
+
+    assert store._collection.rows == {
+        "a": {"embedding": [2.0], "document": "new", "metadata": None}
+    }
+
+
+def test_add_texts_upserts_in_slabs(store, monkeypatch):
+    monkeypatch.setattr("src.vector_stores.chromadb.CHROMA_UPSERT_BATCH_SIZE", 3)
+    texts = [f"text {i}" for i in range(7)]
+
+    ids = store.add_texts(texts, embeddings=[[float(i)] for i in range(7)])
+
+    assert [len(batch) for batch in store._collection.upserts] == [3, 3, 1]
+    assert [row_id for batch in store._collection.upserts for row_id in batch] == ids
+    assert [store._collection.rows[row_id]["document"] for row_id in ids] == texts
+    assert [store._collection.rows[row_id]["embedding"] for row_id in ids] == [
+        [float(i)] for i in range(7)
+    ]
+
+
+def test_add_texts_without_embeddings_uses_the_embedding_function(store):
+    store.add_texts(["abc", "de"], metadatas=[{"k": 1}, {"k": 2}], ids=["a", "b"])
+
+    assert store._embedding_function.calls == 1
+    assert store._collection.rows["a"]["embedding"] == [3.0, 0.0]
+    assert store._collection.rows["b"]["embedding"] == [2.0, 0.0]
+
+
+def test_delete_sources_only_removes_those_sources(store):
+    store.add_texts(
+        ["a", "b", "c"],
+        metadatas=[{SOURCE_METADATA_KEY: s} for s in ("a.md", "b.md", "c.md")],
+        ids=["a", "b", "c"],
+        embeddings=[[1.0], [2.0], [3.0]],
+    )
+
+    store.delete_sources(["a.md", "c.md"])
+    store.delete_sources([])
+
+    assert set(store._collection.rows) == {"b"}
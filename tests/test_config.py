@@ -0,0 +1,115 @@
+"""Tests for the cached global configuration."""
+import os
+import threading
+
+import pytest
+
+from src.config import config as config_module
+from src.config.config import Config
+
+
+def write_config(directory, chunk_size):
+    path = directory / "config.yaml"
+    path.write_text(
+        "loader:\n"
+        "  file_type_mapping:\n"
+        "    .pdf:\n"
+        "      loader_name: pymupdf\n"
+        "chunking:\n"
+        f"  chunk_size: {chunk_size}\n",
+        encoding="utf-8",
+    )
+    return path
+
+
+def bump_mtime(path):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    config_module._load_config.cache_clear()
+    yield
+    config_module._load_config.cache_clear()
+
+
+@pytest.fixture
+def config_path(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return write_config(tmp_path, chunk_size=500)
+
+
+@pytest.fixture
+def loads(monkeypatch):
+    """Count how often the config file is parsed."""
+    calls = []
+    from_file = Config.from_file
+
+    def counting_from_file(path):
+        calls.append(path)
+        return from_file(path)
+
+    monkeypatch.setattr(Config, "from_file", counting_from_file)
+    return calls
+
+
+@pytest.mark.usefixtures("config_path")
+def test_unchanged_file_returns_the_same_instance(loads):
+    first = Config.get_config()
+
+    assert Config.get_config() is first
+    assert first.chunking.chunk_size == 500
+    assert len(loads) == 1
+
+
+def test_modified_file_is_reloaded(config_path, loads):
+    first = Config.get_config()
+    write_config(config_path.parent, chunk_size=800)
+    bump_mtime(config_path)
+
+    reloaded = Config.get_config()
+
+    assert reloaded is not first
+    assert reloaded.chunking.chunk_size == 800
+    assert Config.get_config() is reloaded
+    assert len(loads) == 2
+
+
+def test_touched_file_is_reloaded(config_path):
+    first = Config.get_config()
+    bump_mtime(config_path)
+
+    assert Config.get_config() is not first
+
+
+def test_config_follows_the_working_directory(config_path, tmp_path, monkeypatch):
+    first = Config.get_config()
+    other = tmp_path / "other"
+    other.mkdir()
+    write_config(other, chunk_size=300)
+    monkeypatch.chdir(other)
+
+    assert Config.get_config().chunking.chunk_size == 300
+    monkeypatch.chdir(config_path.parent)
+    assert Config.get_config() is first
+
+
+@pytest.mark.usefixtures("config_path")
+def test_concurrent_calls_share_one_instance(loads):
+    results = []
+    barrier = threading.Barrier(8)
+
+    def load():
+        barrier.wait()
+        results.append(Config.get_config())
+
+    threads = [threading.Thread(target=load) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(results) == 8
+    assert all(result is results[0] for result in results)
+    assert len(loads) == 1
@@ -0,0 +1,158 @@
+"""Tests for the embedding cache, its model key and the query embedding wrapper."""
+import sqlite3
+
+import pytest
+from langchain.schema import Document
+
+from src.config.embedding import EmbeddingConfig
+from src.embeddings.cache import CachedEmbeddings, EmbeddingCache
+from src.embeddings.constants import EMBEDDING_METADATA_KEY
+from src.embeddings.types import EmbeddingModelType
+from src.pipeline.contexts.ingestion_context import IngestionContext
+from src.pipeline.steps.embedding_generation_step import EmbeddingGenerationStep
+
+
+class FakeEmbeddings:
+    """Embedding model recording its calls; vectors encode the text length."""
+
+    def __init__(self):
+        self.calls = []
+
+    def embed_documents(self, texts):
+        self.calls.append(("documents", list(texts)))
+        return [[float(len(text)), 0.0] for text in texts]
+
+    def embed_query(self, text):
+        self.calls.append(("query", text))
+        return [float(len(text)), 1.0]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = EmbeddingCache(tmp_path / "cache.sqlite", provider="huggingface", model="m@1")
+    yield cache
+    cache.close()
+
+
+def test_model_id_changes_with_embed_config_options():
+    base = EmbeddingConfig(embed_config={"model_name": "mini"})
+    fp16 = EmbeddingConfig(embed_config={"model_name": "mini", "precision": "fp16"})
+    normalized = EmbeddingConfig(
+        embed_config={"model_name": "mini", "encode_kwargs": {"normalize_embeddings": True}}
+    )
+
+    ids = {base.get_model_id(), fp16.get_model_id(), normalized.get_model_id()}
+    assert len(ids) == 3
+    assert all(model_id.startswith("mini@") for model_id in ids)
+
+
+def test_model_id_ignores_option_order_and_api_key():
+    config = EmbeddingConfig(
+        embed_name=EmbeddingModelType.OPENAI,
+        embed_config={"model": "text-embedding-3-small", "dimensions": 256, "api_key": "a"},
+    )
+    reordered = EmbeddingConfig(
+        embed_name=EmbeddingModelType.OPENAI,
+        embed_config={"api_key": "b", "dimensions": 256, "model": "text-embedding-3-small"},
+    )
+    assert config.get_model_id() == reordered.get_model_id()
+
+
+def test_model_id_without_embed_config():
+    assert EmbeddingConfig().get_model_id().startswith("default@")
+
+
+def test_lookup_returns_exact_matches(cache):
+    cache.write({"alpha": [1.0, 2.0]})
+
+    found = cache.lookup(["alpha", "beta"])
+
+    assert found == {EmbeddingCache.hash_text("alpha"): [1.0, 2.0]}
+
+
+def test_lookup_is_scoped_to_provider_and_model(tmp_path, cache):
+    cache.write({"alpha": [1.0]})
+    other = EmbeddingCache(tmp_path / "cache.sqlite", provider="huggingface", model="m@2")
+    try:
+        assert other.lookup(["alpha"]) == {}
+    finally:
+        other.close()
+
+
+def test_fuzzy_lookup_matches_whitespace_only(tmp_path):
+    cache = EmbeddingCache(tmp_path / "cache.sqlite", "huggingface", "m@1", fuzzy=True)
+    try:
+        cache.write({"SMPTE ST 2110\nvideo": [1.0]})
+
+        found = cache.lookup(["  SMPTE  ST 2110 video ", "smpte st 2110 video"])
+
+        assert found == {EmbeddingCache.hash_text("  SMPTE  ST 2110 video "): [1.0]}
+    finally:
+        cache.close()
+
+
+def test_exact_lookup_ignores_whitespace_variants(cache):
+    cache.write({"SMPTE ST 2110": [1.0]})
+    assert cache.lookup(["SMPTE  ST 2110"]) == {}
+
+
+def test_cached_embeddings_embeds_each_missing_query_with_embed_query():
+    model = FakeEmbeddings()
+    embeddings = CachedEmbeddings(model)
+
+    vectors = embeddings.embed_queries(["a", "bb", "a"])
+
+    assert vectors == [[1.0, 1.0], [2.0, 1.0], [1.0, 1.0]]
+    assert model.calls == [("query", "a"), ("query", "bb")]
+
+
+def test_cached_embeddings_batches_missing_queries_for_symmetric_models():
+    model = FakeEmbeddings()
+    embeddings = CachedEmbeddings(model, symmetric=True)
+
+    embeddings.embed_queries(["a", "bb"])
+
+    assert model.calls == [("documents", ["a", "bb"])]
+
+
+def test_cached_embeddings_reuses_memory_and_persistent_vectors(cache):
+    model = FakeEmbeddings()
+    CachedEmbeddings(model, cache).embed_query("what is st 2110")
+    assert model.calls == [("query", "what is st 2110")]
+
+    restarted = CachedEmbeddings(model, cache)
+    assert restarted.embed_query("what is st 2110") == [15.0, 1.0]
+    assert restarted.embed_query("what is st 2110") == [15.0, 1.0]
+    assert len(model.calls) == 1
+
+
+def test_generation_step_only_embeds_cache_misses(cache):
+    cache.write({"cached": [9.0, 9.0]})
+    model = FakeEmbeddings()
+    step = EmbeddingGenerationStep(model, EmbeddingModelType.HUGGINGFACE, cache=cache)
+    context = IngestionContext(
+        file_path="doc.pdf",
+        chunks=[Document(page_content="cached"), Document(page_content="fresh")],
+    )
+
+    step.run(context)
+
+    assert context.vectors == [[9.0, 9.0], [5.0, 0.0]]
+    assert model.calls == [("documents", ["fresh"])]
+    assert context.chunks[1].metadata[EMBEDDING_METADATA_KEY] == [5.0, 0.0]
+    assert EmbeddingCache.hash_text("fresh") in cache.lookup(["fresh"])
+
+
+def test_generation_step_embeds_everything_when_the_cache_fails(cache):
+    cache.close()  # any query on a closed connection raises sqlite3.Error
+    model = FakeEmbeddings()
+    step = EmbeddingGenerationStep(model, EmbeddingModelType.HUGGINGFACE, cache=cache)
+    context = IngestionContext(
+        file_path="doc.pdf", chunks=[Document(page_content="a"), Document(page_content="bb")]
+    )
+
+    step.run(context)
+
+    assert context.vectors == [[1.0, 0.0], [2.0, 0.0]]
+    with pytest.raises(sqlite3.Error):
+        cache.lookup(["a"])
@@ -0,0 +1,133 @@
+"""Tests for the HuggingFace embedding model options."""
+from types import SimpleNamespace
+
+import pytest
+
+from src.embeddings import huggingface
+
+
+class FakeHuggingFaceEmbeddings:
+    """Stand-in recording its arguments, with a SentenceTransformer-like client."""
+
+    model_max_seq_length = 256
+
+    def __init__(self, model_name, model_kwargs=None, encode_kwargs=None):
+        self.model_name = model_name
+        self.model_kwargs = model_kwargs or {}
+        self.encode_kwargs = encode_kwargs or {}
+        self._client = SimpleNamespace(max_seq_length=self.model_max_seq_length)
+
+
+@pytest.fixture(autouse=True)
+def fake_embeddings(monkeypatch):
+    monkeypatch.setattr(huggingface, "HuggingFaceEmbeddings", FakeHuggingFaceEmbeddings)
+
+
+@pytest.mark.parametrize(
+    ("precision", "dtype"), [("fp32", "float32"), ("fp16", "float16"), ("bf16", "bfloat16")]
+)
+def test_precision_sets_the_torch_dtype(precision, dtype):
+    embeddings = huggingface.create_huggingface_embedding({"precision": precision})
+
+    assert embeddings.model_kwargs == {"model_kwargs": {"torch_dtype": dtype}}
+
+
+def test_precision_keeps_other_model_kwargs():
+    embeddings = huggingface.create_huggingface_embedding(
+        {
+            "precision": "fp16",
+            "model_kwargs": {"device": "cuda", "model_kwargs": {"attn_implementation": "sdpa"}},
+        }
+    )
+
+    assert embeddings.model_kwargs == {
+        "device": "cuda",
+        "model_kwargs": {"attn_implementation": "sdpa", "torch_dtype": "float16"},
+    }
+
+
+def test_unknown_precision_is_rejected():
+    with pytest.raises(ValueError, match="Unsupported precision"):
+        huggingface.create_huggingface_embedding({"precision": "int8"})
+
+
+def test_config_is_not_modified():
+    config = {"precision": "fp16", "model_kwargs": {"device": "cuda"}}
+
+    huggingface.create_huggingface_embedding(config)
+
+    assert config == {"precision": "fp16", "model_kwargs": {"device": "cuda"}}
+
+
+@pytest.mark.parametrize("backend", ["torch", "onnx", "openvino"])
+def test_backend_moves_into_model_kwargs(backend):
+    embeddings = huggingface.create_huggingface_embedding(
+        {"backend": backend, "model_kwargs": {"device": "cpu"}}
+    )
+
+    assert embeddings.model_kwargs == {"device": "cpu", "backend": backend}
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError, match="Unsupported backend"):
+        huggingface.create_huggingface_embedding({"backend": "tensorrt"})
+
+
+def test_precision_with_torch_backend_is_accepted():
+    embeddings = huggingface.create_huggingface_embedding(
+        {"backend": "torch", "precision": "bf16"}
+    )
+
+    assert embeddings.model_kwargs == {
+        "backend": "torch",
+        "model_kwargs": {"torch_dtype": "bfloat16"},
+    }
+
+
+@pytest.mark.parametrize("backend", ["onnx", "openvino"])
+def test_precision_with_other_backend_is_rejected(backend):
+    with pytest.raises(ValueError, match="only applies to the 'torch' backend"):
+        huggingface.create_huggingface_embedding({"backend": backend, "precision": "fp16"})
+
+
+def test_max_seq_length_is_set_on_the_client():
+    embeddings = huggingface.create_huggingface_embedding({"max_seq_length": 128})
+
+    assert embeddings._client.max_seq_length == 128
+    assert embeddings.model_kwargs == {}
+
+
+def test_max_seq_length_never_raises_the_model_limit():
+    embeddings = huggingface.create_huggingface_embedding({"max_seq_length": 4096})
+
+    assert embeddings._client.max_seq_length == FakeHuggingFaceEmbeddings.model_max_seq_length
+
+
+def test_max_seq_length_applies_to_models_without_a_limit(monkeypatch):
+    monkeypatch.setattr(FakeHuggingFaceEmbeddings, "model_max_seq_length", None)
+
+    embeddings = huggingface.create_huggingface_embedding({"max_seq_length": 512})
+
+    assert embeddings._client.max_seq_length == 512
+
+
+@pytest.mark.parametrize("max_seq_length", [0, -1, 1.5, "128", True])
+def test_invalid_max_seq_length_is_rejected(max_seq_length):
+    with pytest.raises(ValueError, match="max_seq_length must be a positive integer"):
+        huggingface.create_huggingface_embedding({"max_seq_length": max_seq_length})
+
+
+@pytest.mark.parametrize("client", [None, object()])
+def test_max_seq_length_without_a_client_fails_loudly(monkeypatch, client):
+    class ClientlessEmbeddings(FakeHuggingFaceEmbeddings):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            if client is None:
+                del self._client
+            else:
+                self._client = client
+
+    monkeypatch.setattr(huggingface, "HuggingFaceEmbeddings", ClientlessEmbeddings)
+
+    with pytest.raises(ValueError, match="max_seq_length is not supported"):
+        huggingface.create_huggingface_embedding({"max_seq_length": 128})
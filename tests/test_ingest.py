@@ -0,0 +1,226 @@
+"""Tests for grouped chunking, embedding and saving in the ingest command."""
+import sqlite3
+
+import pytest
+from langchain.schema import Document
+
+from src.chunkers.constants import SOURCE_METADATA_KEY
+from src.cli import ingest
+from src.config import Config
+from src.embeddings.cache import EmbeddingCache
+from src.pipeline.contexts.ingestion_context import IngestionContext
+
+# Chunk size minus overlap, times batch size, times EMBED_GROUP_BATCHES
+GROUP_CHARS = 10 * 2 * ingest.EMBED_GROUP_BATCHES
+
+
+class LineChunker:
+    """Chunker returning one chunk per line of each Markdown file."""
+
+    def __init__(self, interleave=False):
+        self.calls = []
+        self.interleave = interleave
+
+    def chunk_markdown_files(self, file_paths):
+        self.calls.append([path.name for path in file_paths])
+        per_file = [
+            [
+                Document(page_content=line, metadata={SOURCE_METADATA_KEY: str(path)})
+                for line in path.read_text(encoding="utf-8").splitlines()
+            ]
+            for path in file_paths
+        ]
+        if not self.interleave:
+            return [chunk for chunks in per_file for chunk in chunks]
+        # Round-robin across files, as a parallel chunker may return them
+        return [
+            chunks[i]
+            for i in range(max(len(chunks) for chunks in per_file))
+            for chunks in per_file
+            if i < len(chunks)
+        ]
+
+
+class LengthEmbeddings:
+    """Embedding model recording batch sizes; vectors encode the text length."""
+
+    def __init__(self, fail_on=None):
+        self.batch_sizes = []
+        self.fail_on = fail_on
+
+    def embed_documents(self, texts):
+        if self.fail_on in texts:
+            raise RuntimeError("embedding failed")
+        self.batch_sizes.append(len(texts))
+        return [[float(len(text))] for text in texts]
+
+
+class RecordingStore:
+    """Vector store recording each save and persist."""
+
+    def __init__(self):
+        self.saved = []
+        self.deleted = []
+        self.persist_calls = 0
+
+    def delete_sources(self, sources):
+        self.deleted.append(list(sources))
+
+    def add_texts(self, texts, metadatas=None, ids=None, embeddings=None):
+        self.saved.append({"texts": texts, "metadatas": metadatas, "embeddings": embeddings})
+        return ids
+
+    def persist(self):
+        self.persist_calls += 1
+
+
+class RecordingIngestedFiles:
+    """Ingested-file record keeping the recorded paths in memory."""
+
+    def __init__(self):
+        self.recorded = []
+        self.closed = False
+
+    def record(self, file_path):
+        self.recorded.append(file_path)
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def config(tmp_path):
+    return Config(
+        loader={"file_type_mapping": {".pdf": {"loader_name": "pymupdf"}}},
+        chunking={"chunk_size": 15, "chunk_overlap": 5},
+        embedding={"batch_size": 2},
+        vector_store={"persist_directory": tmp_path / "db"},
+        paths={"input_path": tmp_path},
+    )
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return EmbeddingCache(tmp_path / "cache.sqlite", "huggingface", "test-model")
+
+
+def assert_closed(cache):
+    with pytest.raises(sqlite3.ProgrammingError):
+        cache.lookup(["text"])
+
+
+@pytest.fixture
+def files(tmp_path):
+    """Five loaded files; the Markdown of each two fills one group."""
+    contexts = []
+    for i in range(5):
+        lines = [f"file{i} line{j}" for j in range(i + 3)]
+        text = "\n".join(lines) + "\n" + "x" * (GROUP_CHARS // 2)
+        markdown_path = tmp_path / f"file{i}.md"
+        markdown_path.write_text(text, encoding="utf-8")
+        contexts.append(
+            IngestionContext(
+                file_path=tmp_path / f"file{i}.pdf",
+                markdown_path=markdown_path,
+                raw_text=text,
+            )
+        )
+    return contexts
+
+
+def expected_lines(context):
+    return context.raw_text.splitlines()
+
+
+@pytest.mark.parametrize("interleave", [False, True])
+def test_files_are_chunked_in_groups_and_keep_their_own_chunks(config, files, interleave):
+    chunker, store = LineChunker(interleave), RecordingStore()
+    expected = [expected_lines(context) for context in files]
+
+    ingest.ingest_files(iter(files), config, chunker, LengthEmbeddings(), store)
+
+    assert chunker.calls == [
+        ["file0.md", "file1.md"],
+        ["file2.md", "file3.md"],
+        ["file4.md"],
+    ]
+    assert [save["texts"] for save in store.saved] == expected
+    for context, save in zip(files, store.saved):
+        assert {m[SOURCE_METADATA_KEY] for m in save["metadatas"]} == {
+            str(context.markdown_path)
+        }
+        assert save["embeddings"] == [[float(len(text))] for text in save["texts"]]
+    assert store.deleted == [[str(context.markdown_path)] for context in files]
+    assert store.persist_calls == 1
+
+
+def test_embedding_batches_span_file_boundaries(config, files):
+    embeddings = LengthEmbeddings()
+
+    ingest.ingest_files(iter(files[:2]), config, LineChunker(), embeddings, RecordingStore())
+
+    # 3 + 1 and 4 + 1 chunks: 9 chunks in batches of 2
+    assert embeddings.batch_sizes == [2, 2, 2, 2, 1]
+
+
+def test_saved_files_are_recorded_and_released(config, files, cache):
+    ingested_files = RecordingIngestedFiles()
+
+    ingest.ingest_files(
+        iter(files), config, LineChunker(), LengthEmbeddings(), RecordingStore(),
+        cache, ingested_files,
+    )
+
+    assert ingested_files.recorded == [context.file_path for context in files]
+    assert all(not context.chunks and context.raw_text is None for context in files)
+    assert ingested_files.closed
+    assert_closed(cache)
+
+
+def test_store_is_persisted_once_when_a_group_fails(config, files, cache):
+    store, ingested_files = RecordingStore(), RecordingIngestedFiles()
+    embeddings = LengthEmbeddings(fail_on="file3 line0")
+
+    with pytest.raises(RuntimeError, match="embedding failed"):
+        ingest.ingest_files(
+            iter(files), config, LineChunker(), embeddings, store, cache, ingested_files,
+        )
+
+    assert len(store.saved) == 2
+    assert ingested_files.recorded == [files[0].file_path, files[1].file_path]
+    assert store.persist_calls == 1
+    assert ingested_files.closed
+    assert_closed(cache)
+
+
+def test_probed_batch_size_is_reused_without_touching_the_config(config, files, monkeypatch):
+    config.embedding.auto_batch_size = True
+    probes = []
+
+    def probe(_model, sample_texts, **_kwargs):
+        probes.append(len(sample_texts))
+        return 3
+
+    monkeypatch.setattr(ingest, "find_optimal_embed_batch", probe)
+    embeddings = LengthEmbeddings()
+
+    ingest.ingest_files(iter(files), config, LineChunker(), embeddings, RecordingStore())
+
+    assert probes == [9]
+    assert max(embeddings.batch_sizes) == 3
+    assert embeddings.batch_sizes.count(3) > 2
+    assert config.embedding.batch_size == 2
+    assert config.embedding.auto_batch_size
+
+
+def test_settings_id_changes_with_chunking_and_model(config):
+    settings = ingest.ingest_settings_id(config)
+
+    resized = config.model_copy(deep=True)
+    resized.chunking.chunk_size = 20
+    other_model = config.model_copy(deep=True)
+    other_model.embedding.embed_config = {"model_name": "another-model"}
+
+    assert ingest.ingest_settings_id(resized) != settings
+    assert ingest.ingest_settings_id(other_model) != settings
+    assert ingest.ingest_settings_id(config.model_copy(deep=True)) == settings
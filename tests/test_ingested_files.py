@@ -0,0 +1,96 @@
+"""Tests for the record of ingested input files."""
+import os
+import sqlite3
+
+import pytest
+
+from src.vector_stores.ingested_files import IngestedFiles
+
+
+@pytest.fixture
+def ingested(tmp_path):
+    record = IngestedFiles(
+        tmp_path / "db" / "ingested_files.sqlite", "rag_collection", settings="chunks-v1"
+    )
+    yield record
+    record.close()
+
+
+@pytest.fixture
+def input_file(tmp_path):
+    path = tmp_path / "st2110.pdf"
+    path.write_bytes(b"%PDF-1.7 original")
+    return path
+
+
+def test_new_file_is_not_unchanged(ingested, input_file):
+    assert not ingested.is_unchanged(input_file)
+
+
+def test_recorded_file_is_unchanged(ingested, input_file):
+    ingested.record(input_file)
+
+    assert ingested.is_unchanged(input_file)
+
+
+def test_touched_file_with_same_content_is_unchanged(ingested, input_file):
+    ingested.record(input_file)
+    stat = input_file.stat()
+    os.utime(input_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    assert ingested.is_unchanged(input_file)
+
+
+def test_modified_file_is_changed(ingested, input_file):
+    ingested.record(input_file)
+    input_file.write_bytes(b"%PDF-1.7 revised!")
+
+    assert not ingested.is_unchanged(input_file)
+
+
+def test_records_are_scoped_to_the_collection(tmp_path, ingested, input_file):
+    ingested.record(input_file)
+    other = IngestedFiles(
+        tmp_path / "db" / "ingested_files.sqlite", "other_collection", settings="chunks-v1"
+    )
+    try:
+        assert not other.is_unchanged(input_file)
+    finally:
+        other.close()
+
+
+def test_file_ingested_with_other_settings_is_changed(tmp_path, ingested, input_file):
+    ingested.record(input_file)
+    resized = IngestedFiles(
+        tmp_path / "db" / "ingested_files.sqlite", "rag_collection", settings="chunks-v2"
+    )
+    try:
+        assert not resized.is_unchanged(input_file)
+        resized.record(input_file)
+        assert resized.is_unchanged(input_file)
+    finally:
+        resized.close()
+
+
+def test_records_without_settings_are_dropped(tmp_path, input_file):
+    path = tmp_path / "ingested_files.sqlite"
+    conn = sqlite3.connect(str(path))
+    conn.execute(
+        "CREATE TABLE ingested_files (collection TEXT, path TEXT, hash TEXT, "
+        "mtime_ns INTEGER, size INTEGER, chunk_count INTEGER, PRIMARY KEY (collection, path))"
+    )
+    stat = input_file.stat()
+    conn.execute(
+        "INSERT INTO ingested_files VALUES (?, ?, ?, ?, ?, ?)",
+        ("rag_collection", str(input_file.resolve()), "x", stat.st_mtime_ns, stat.st_size, 3),
+    )
+    conn.commit()
+    conn.close()
+
+    record = IngestedFiles(path, "rag_collection", settings="chunks-v1")
+    try:
+        assert not record.is_unchanged(input_file)
+        record.record(input_file)
+        assert record.is_unchanged(input_file)
+    finally:
+        record.close()
@@ -0,0 +1,87 @@
+"""Tests for the LangChain chunker's batched token splitting."""
+import pytest
+from langchain.text_splitter import TokenTextSplitter
+
+from src.chunkers.constants import (
+    CHUNK_INDEX_METADATA_KEY,
+    SOURCE_METADATA_KEY,
+    TOTAL_CHUNKS_METADATA_KEY,
+)
+from src.chunkers.langchain_chunker import LangChainChunker
+
+tiktoken = pytest.importorskip("tiktoken")
+
+# GPT-2 pre-tokenization over single-byte tokens: the real vocabularies are
+# downloaded on first use, and the window slicing does not depend on merges
+_PAT_STR = (
+    r"""'s|'t|'re|'ve|'m|'ll|'d| ?\p{L}+| ?\p{N}+| ?[^\s\p{L}\p{N}]+|\s+(?!\S)|\s+"""
+)
+
+
+@pytest.fixture(autouse=True)
+def byte_encoding(monkeypatch):
+    encoding = tiktoken.Encoding(
+        name="test-bytes",
+        pat_str=_PAT_STR,
+        mergeable_ranks={bytes([i]): i for i in range(256)},
+        special_tokens={"<|endoftext|>": 256},
+    )
+    monkeypatch.setattr(tiktoken, "get_encoding", lambda _name: encoding)
+    LangChainChunker.clear_cache()
+    yield encoding
+    LangChainChunker.clear_cache()
+
+
+@pytest.fixture
+def markdown_files(tmp_path):
+    texts = {
+        "a.md": "# SMPTE ST 2110\n\nProfessional media over managed IP networks. " * 7,
+        "b.md": "Short file.",
+        "c.md": "Timing is defined by SMPTE ST 2059 (PTP).\n" * 11,
+    }
+    paths = []
+    for name, text in texts.items():
+        path = tmp_path / name
+        path.write_text(text, encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+@pytest.mark.parametrize(("chunk_size", "chunk_overlap"), [(64, 0), (64, 16), (50, 49)])
+def test_token_windows_match_token_text_splitter(markdown_files, chunk_size, chunk_overlap):
+    chunker = LangChainChunker(chunk_size=chunk_size, chunk_overlap=chunk_overlap, method="token")
+    documents = [
+        LangChainChunker._load_markdown_document(path, "utf-8") for path in markdown_files
+    ]
+    splitter = TokenTextSplitter(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+
+    expected = splitter.split_documents(documents)
+    chunks = chunker.chunk_markdown_files(markdown_files)
+
+    assert [chunk.page_content for chunk in chunks] == [doc.page_content for doc in expected]
+    assert [chunk.metadata[SOURCE_METADATA_KEY] for chunk in chunks] == [
+        doc.metadata[SOURCE_METADATA_KEY] for doc in expected
+    ]
+
+
+def test_token_chunks_are_numbered_per_file(markdown_files):
+    chunker = LangChainChunker(chunk_size=32, chunk_overlap=8, method="token")
+
+    chunks = chunker.chunk_markdown_files(markdown_files)
+
+    for path in markdown_files:
+        own = [c for c in chunks if c.metadata[SOURCE_METADATA_KEY] == str(path)]
+        assert [c.metadata[CHUNK_INDEX_METADATA_KEY] for c in own] == list(range(len(own)))
+        assert {c.metadata[TOTAL_CHUNKS_METADATA_KEY] for c in own} == {len(own)}
+
+
+def test_special_token_text_is_chunked_as_plain_text(tmp_path):
+    # TokenTextSplitter rejects special tokens; the batched path encodes
+    # them as ordinary text instead
+    path = tmp_path / "special.md"
+    path.write_text("before <|endoftext|> after", encoding="utf-8")
+    chunker = LangChainChunker(chunk_size=100, chunk_overlap=0, method="token")
+
+    chunks = chunker.chunk_markdown_files([path])
+
+    assert [chunk.page_content for chunk in chunks] == ["before <|endoftext|> after"]
@@ -0,0 +1,63 @@
+"""Tests for the retriever wrapper serializing vector store access."""
+import threading
+import time
+
+from src.retrievers.locked_retriever import LockedRetriever
+
+
+class SlowRetriever:
+    """Retriever recording how many retrievals overlap."""
+
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+        self._count_lock = threading.Lock()
+
+    def _search(self, query):
+        with self._count_lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(0.01)
+        with self._count_lock:
+            self.active -= 1
+        return [(query, 0.0)]
+
+    def retrieve(self, query):
+        return [doc for doc, _ in self._search(query)]
+
+    def retrieve_with_scores(self, query):
+        return self._search(query)
+
+
+def test_concurrent_retrievals_run_one_at_a_time():
+    retriever = SlowRetriever()
+    locked = LockedRetriever(retriever)
+    results = []
+
+    def worker(i):
+        method = locked.retrieve if i % 2 else locked.retrieve_with_scores
+        results.append(method(f"query {i}"))
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert retriever.max_active == 1
+    assert len(results) == 8
+
+
+def test_shared_lock_is_held_during_retrieval():
+    lock = threading.Lock()
+    seen = []
+
+    class Probe:
+        def retrieve_with_scores(self, _query):
+            seen.append(lock.locked())
+            return []
+
+    LockedRetriever(Probe(), lock).retrieve_with_scores("q")
+
+    assert seen == [True]
+    assert not lock.locked()
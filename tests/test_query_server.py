@@ -0,0 +1,81 @@
+"""Tests for the query server's socket protocol."""
+import json
+import socket
+import socketserver
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from src.cli import query_server
+from src.pipeline import PipelineStatus
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    def execute_query(_components, query):
+        return SimpleNamespace(
+            status=PipelineStatus.COMPLETED,
+            llm_response=f"answer to {query}",
+            citations=[],
+            retrieved_docs=[],
+            error=None,
+        )
+
+    monkeypatch.setattr(query_server, "execute_query", execute_query)
+    socket_path = tmp_path / "query.sock"
+    with socketserver.ThreadingUnixStreamServer(
+        str(socket_path), query_server._QueryHandler
+    ) as unix_server:
+        unix_server.components = None
+        thread = threading.Thread(
+            target=unix_server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+        )
+        thread.start()
+        yield socket_path
+        unix_server.shutdown()
+        thread.join()
+
+
+def send(socket_path, payload: bytes) -> dict:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(str(socket_path))
+        client.sendall(payload)
+        client.shutdown(socket.SHUT_WR)
+        with client.makefile("rb") as stream:
+            return json.loads(stream.readline())
+
+
+def test_valid_request_is_answered(server):
+    result = send(server, b'{"query": "What is ST 2110?"}\n')
+
+    assert result["status"] == PipelineStatus.COMPLETED.value
+    assert result["answer"] == "answer to What is ST 2110?"
+    assert result["error"] is None
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        b"not json\n",
+        b"\xff\xfe\n",
+        b"",
+        b'["What is ST 2110?"]\n',
+        b'{"question": "What is ST 2110?"}\n',
+        b'{"query": 2110}\n',
+    ],
+)
+def test_malformed_request_gets_an_error_line(server, payload):
+    result = send(server, payload)
+
+    assert result["status"] == PipelineStatus.FAILED.value
+    assert result["answer"] is None
+    assert result["error"].startswith("Invalid request")
+
+
+def test_server_keeps_serving_after_a_malformed_request(server):
+    send(server, b"not json\n")
+
+    result = send(server, b'{"query": "still there?"}\n')
+
+    assert result["answer"] == "answer to still there?"